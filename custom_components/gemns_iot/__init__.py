@@ -1,12 +1,10 @@
 """The Gemns™ IoT integration."""
 
-import json
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import service
 
 from .const import DOMAIN
 from .device_management import GemnsDeviceManager
@@ -15,17 +13,17 @@ from .ble_coordinator import GemnsBluetoothProcessorCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.BINARY_SENSOR,
     Platform.SENSOR,
     Platform.SWITCH,
     Platform.LIGHT,
-]
+)
 
 # BLE platform
-BLE_PLATFORMS: list[Platform] = [
+BLE_PLATFORMS: tuple[Platform, ...] = (
     Platform.SENSOR,
-]
+)
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Gemns™ IoT from a config entry."""
@@ -68,12 +66,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "config": entry.data
         }
 
-        # Register services
-        await _register_services(hass, device_manager)
-
-        # Forward the setup to the relevant platforms
+        # Forward the setup to the relevant platforms before exposing services,
+        # so a reload triggered by a service call can't race platform setup
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+        # Register services
+        await _register_services(hass, device_manager, entry)
+
         return True
 
 
@@ -100,7 +99,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
-async def _register_services(hass: HomeAssistant, device_manager: GemnsDeviceManager):
+async def _register_services(
+    hass: HomeAssistant, device_manager: GemnsDeviceManager, entry: ConfigEntry
+):
     """Register Gemns™ IoT services."""
     
     async def add_device(service_call):
@@ -111,8 +112,7 @@ async def _register_services(hass: HomeAssistant, device_manager: GemnsDeviceMan
     async def remove_device(service_call):
         """Remove a device."""
         device_id = service_call.data.get("device_id")
-        if device_id and device_id in device_manager.devices:
-            del device_manager.devices[device_id]
+        if device_id and device_manager.remove_device(device_id):
             hass.bus.async_fire(f"{DOMAIN}_device_removed", {"device_id": device_id})
     
     async def create_entities_for_devices(service_call):
@@ -121,8 +121,9 @@ async def _register_services(hass: HomeAssistant, device_manager: GemnsDeviceMan
         all_devices = device_manager.get_all_devices()
         _LOGGER.info(f"Found {len(all_devices)} devices to create entities for")
         
-        # Trigger platform reload to create entities for new devices
-        await hass.config_entries.async_reload(config_entry.entry_id)
+        # Schedule a platform reload to create entities for new devices; the
+        # reload tears down this entry, so don't await it from the service call
+        hass.config_entries.async_schedule_reload(entry.entry_id)
     
     # Register services (removed MQTT dongle services)
     hass.services.async_register(DOMAIN, "add_device", add_device)
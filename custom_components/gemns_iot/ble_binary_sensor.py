@@ -1,23 +1,88 @@
 """BLE binary sensor platform for Gemns™ IoT integration."""
 
 import logging
-from typing import Any, Dict, Optional
-from datetime import datetime, timezone
+from typing import Any, Dict
+from datetime import datetime
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorDeviceClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 
 from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
 from .ble_coordinator import GemnsBluetoothProcessorCoordinator
+from .util import professional_device_id
 
 _LOGGER = logging.getLogger(__name__)
 
+# Window for coalescing state writes from bursts of advertisements (seconds)
+STATE_WRITE_DEBOUNCE = 0.05
+
+# Binary sensor properties per device type (matching device_type_t enum):
+# device_type -> (device class, name prefix, icon)
+_SENSOR_SPEC: dict[str, tuple[BinarySensorDeviceClass, str, str]] = {
+    # DEVICE_TYPE_LEAK_SENSOR = 4 - moisture device class
+    "leak_sensor": (BinarySensorDeviceClass.MOISTURE, "Gemns™ IoT Leak Sensor", "mdi:water"),
+    # DEVICE_TYPE_VIBRATION_MONITOR = 2 - vibration device class
+    "vibration_sensor": (BinarySensorDeviceClass.VIBRATION, "Gemns™ IoT Vibration Monitor", "mdi:vibrate"),
+    # DEVICE_TYPE_TWO_WAY_SWITCH = 3 - opening device class (on/off)
+    "two_way_switch": (BinarySensorDeviceClass.OPENING, "Gemns™ IoT Two-Way Switch", "mdi:toggle-switch"),
+    # DEVICE_TYPE_BUTTON = 1, DEVICE_TYPE_LEGACY = 0 - problem device class
+    "button": (BinarySensorDeviceClass.PROBLEM, "Gemns™ IoT Button", "mdi:gesture-tap-button"),
+    "legacy": (BinarySensorDeviceClass.PROBLEM, "Gemns™ IoT Legacy Device", "mdi:chip"),
+}
+# Unknown device type - generic binary sensor
+_DEFAULT_SENSOR_SPEC = (BinarySensorDeviceClass.PROBLEM, "Gemns™ IoT Alert", "mdi:alert")
+
+# Device model per device type (matching device_type_t enum)
+_MODEL_MAP: dict[str, str] = {
+    "legacy": "Batteryless Legacy Device",           # DEVICE_TYPE_LEGACY = 0
+    "button": "Batteryless Button",                  # DEVICE_TYPE_BUTTON = 1
+    "vibration_sensor": "Batteryless Vibration Monitor", # DEVICE_TYPE_VIBRATION_MONITOR = 2
+    "two_way_switch": "Batteryless Two-Way Switch",  # DEVICE_TYPE_TWO_WAY_SWITCH = 3
+    "leak_sensor": "Batteryless Leak Sensor",        # DEVICE_TYPE_LEAK_SENSOR = 4
+    "unknown_device": "Batteryless IoT Device"
+}
+
+# Suggested area per device type
+_AREA_MAP: dict[str, str] = {
+    "leak_sensor": "Kitchen",
+    "vibration_sensor": "Garage",
+    "button": "Living Room",
+    "two_way_switch": "Bedroom",
+    "legacy": "Office"
+}
+
+# Device image per device type
+_DEFAULT_IMAGE = "/local/custom_components/gemns/static/icon.png"
+_IMAGE_MAP: dict[str, str] = {
+    "leak_sensor": _DEFAULT_IMAGE,
+    "vibration_sensor": _DEFAULT_IMAGE,
+    "two_way_switch": _DEFAULT_IMAGE,
+    "button": _DEFAULT_IMAGE,
+    "legacy": _DEFAULT_IMAGE,
+}
+
+# Binary state keys in sensor_data, checked in order before falling back to sensor_event
+_BINARY_KEYS: tuple[str, ...] = (
+    "leak_detected",       # DEVICE_TYPE_LEAK_SENSOR = 4 - EVENT_TYPE_LEAK_DETECTED = 4
+    "vibration_detected",  # DEVICE_TYPE_VIBRATION_MONITOR = 2 - EVENT_TYPE_VIBRATION = 1
+    "switch_on",           # DEVICE_TYPE_TWO_WAY_SWITCH = 3 - EVENT_TYPE_BUTTON_ON = 3
+    "button_pressed",      # DEVICE_TYPE_BUTTON = 1, DEVICE_TYPE_LEGACY = 0 - EVENT_TYPE_BUTTON_PRESS = 0
+)
+
+# sensor_data keys exposed as state attributes when present
+_SENSOR_ATTRIBUTE_KEYS: tuple[str, ...] = ("leak_detected", "event_counter", "sensor_event")
+
+# Sentinel for keys missing from sensor_data (values may legitimately be None)
+_MISSING = object()
+
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -44,15 +109,8 @@ async def async_setup_entry(
     
     _LOGGER.info("BLE coordinator found for entry %s, creating binary sensor entities", config_entry.entry_id)
     
-    # Create binary sensor entities based on device type
-    entities = []
-    
     # Create a binary sensor entity for leak detection
-    binary_sensor_entity = GemnsBLEBinarySensor(coordinator, config_entry)
-    entities.append(binary_sensor_entity)
-    
-    if entities:
-        async_add_entities(entities)
+    async_add_entities((GemnsBLEBinarySensor(coordinator, config_entry),))
 
 
 class GemnsBLEBinarySensor(BinarySensorEntity):
@@ -89,6 +147,15 @@ class GemnsBLEBinarySensor(BinarySensorEntity):
         
         # Device type will be determined from coordinator data
         self._device_type = "unknown"
+        # Last logged update error and how often it has repeated since
+        self._last_error: str | None = None
+        self._error_repeats = 0
+        # Cancel callback for a pending coalesced state write
+        self._cancel_pending_write: CALLBACK_TYPE | None = None
+        # (device_type, firmware_version) the entity was last configured for
+        self._configured_for: tuple[str, str | None] | None = None
+        # Coordinator data object the entity was last updated from
+        self._last_data: dict[str, Any] | None = None
         
     @property
     def address(self) -> str:
@@ -115,20 +182,18 @@ class GemnsBLEBinarySensor(BinarySensorEntity):
         if self.coordinator.data:
             attrs.update({
                 "rssi": self.coordinator.data.get("rssi"),
-                "last_seen": self.coordinator.data.get("timestamp"),
+                "last_seen": self.coordinator.last_seen,
                 "ble_status": "active" if self.coordinator.available else "inactive",
-                "last_update_success": getattr(self.coordinator, 'last_update_success', True),
+                "last_update_success": self.coordinator.last_update_success,
             })
             
             # Add sensor-specific attributes
-            if "sensor_data" in self.coordinator.data:
-                sensor_data = self.coordinator.data["sensor_data"]
-                if "leak_detected" in sensor_data:
-                    attrs["leak_detected"] = sensor_data["leak_detected"]
-                if "event_counter" in sensor_data:
-                    attrs["event_counter"] = sensor_data["event_counter"]
-                if "sensor_event" in sensor_data:
-                    attrs["sensor_event"] = sensor_data["sensor_event"]
+            sensor_data = self.coordinator.data.get("sensor_data")
+            if sensor_data:
+                for key in _SENSOR_ATTRIBUTE_KEYS:
+                    value = sensor_data.get(key, _MISSING)
+                    if value is not _MISSING:
+                        attrs[key] = value
         
         return attrs
 
@@ -139,9 +204,16 @@ class GemnsBLEBinarySensor(BinarySensorEntity):
         self._unsub_coordinator = self.coordinator.async_add_listener(self._handle_coordinator_update)
         # Set up cleanup when entity is removed
         self.async_on_remove(self._unsub_coordinator)
+        self.async_on_remove(self._async_cancel_pending_write)
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        # Fallback polls re-notify with the same data object; nothing changed
+        data = self.coordinator.data
+        if data is self._last_data and self._configured_for is not None:
+            return
+        self._last_data = data
+        
         try:
             # Store previous state to detect changes
             previous_state = self._attr_is_on
@@ -152,10 +224,45 @@ class GemnsBLEBinarySensor(BinarySensorEntity):
             if previous_state != self._attr_is_on:
                 _LOGGER.info("BINARY SENSOR STATE CHANGED: %s | Previous: %s | New: %s", 
                            self.address, previous_state, self._attr_is_on)
-            
-            self.async_write_ha_state()
+                # Write state changes immediately so automations see edges without delay
+                self._async_cancel_pending_write()
+                self.async_write_ha_state()
+            else:
+                self._async_schedule_coalesced_write()
+            self._last_error = None
         except Exception as e:
-            _LOGGER.error("Error handling coordinator update for %s: %s", self.address, e)
+            # Malformed data repeats on every advertisement; log each distinct
+            # error once and count the repeats instead of flooding the log
+            error = repr(e)
+            if error != self._last_error:
+                _LOGGER.error("Error handling coordinator update for %s: %s", self.address, e)
+                self._last_error = error
+                self._error_repeats = 0
+            else:
+                self._error_repeats += 1
+                _LOGGER.debug("Error repeated %d times for %s: %s",
+                              self._error_repeats, self.address, e)
+
+    @callback
+    def _async_schedule_coalesced_write(self) -> None:
+        """Schedule a single state write for a burst of unchanged updates."""
+        if self._cancel_pending_write is None:
+            self._cancel_pending_write = async_call_later(
+                self.hass, STATE_WRITE_DEBOUNCE, self._async_flush_state
+            )
+
+    @callback
+    def _async_flush_state(self, _now: datetime) -> None:
+        """Write the latest state after the debounce window."""
+        self._cancel_pending_write = None
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_pending_write(self) -> None:
+        """Cancel a pending coalesced state write."""
+        if self._cancel_pending_write is not None:
+            self._cancel_pending_write()
+            self._cancel_pending_write = None
 
     def _update_from_coordinator(self) -> None:
         """Update binary sensor state from coordinator data."""
@@ -167,96 +274,59 @@ class GemnsBLEBinarySensor(BinarySensorEntity):
             return
             
         data = self.coordinator.data
-        _LOGGER.info("UPDATING BINARY SENSOR: %s | Coordinator data: %s", self.address, data)
-        
-        # Update device type and name from coordinator data
-        self._device_type = data.get("device_type", "unknown")
-        coordinator_name = data.get("name", "Gemns™ IoT Device")
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("UPDATING BINARY SENSOR: %s | Coordinator data: %s", self.address, data)
         
-        # Update the entity name if coordinator has a better name
-        if coordinator_name != "Gemns™ IoT Device":
-            self._attr_name = coordinator_name
-        
-        _LOGGER.info("DEVICE TYPE: %s | Type: %s | Name: %s", self.address, self._device_type, self._attr_name)
-        
-        # Set sensor properties based on device type
-        self._set_sensor_properties()
-        
-        # Update device info with proper name and model
-        self._update_device_info()
+        # Name, properties and device info only depend on the device type and
+        # firmware version, so skip reconfiguring when neither has changed
+        device_type = data.get("device_type", "unknown")
+        configured_for = (device_type, data.get("firmware_version"))
+        if configured_for != self._configured_for:
+            self._configured_for = configured_for
+            
+            # Update device type and name from coordinator data
+            self._device_type = device_type
+            coordinator_name = data.get("name", "Gemns™ IoT Device")
+            
+            # Update the entity name if coordinator has a better name
+            if coordinator_name != "Gemns™ IoT Device":
+                self._attr_name = coordinator_name
+            
+            if debug:
+                _LOGGER.debug("DEVICE TYPE: %s | Type: %s | Name: %s", self.address, self._device_type, self._attr_name)
+            
+            # Set sensor properties based on device type
+            self._set_sensor_properties()
+            
+            # Update device info with proper name and model
+            self._update_device_info()
         
         # Extract binary sensor value
         self._extract_binary_sensor_value(data)
         
         # Update availability
         self._attr_available = True
-        _LOGGER.info("BINARY SENSOR UPDATED: %s | Available: %s | Value: %s | BLE_active: %s | Coordinator_available: %s", 
-                     self.address, self._attr_available, self._attr_is_on, True, self.coordinator.available)
+        if debug:
+            _LOGGER.debug("BINARY SENSOR UPDATED: %s | Available: %s | Value: %s | BLE_active: %s | Coordinator_available: %s", 
+                          self.address, self._attr_available, self._attr_is_on, True, self.coordinator.available)
         
     def _set_sensor_properties(self) -> None:
         """Set binary sensor properties based on device type (matching device_type_t enum)."""
-        device_type = self._device_type.lower()
-        
-        # Set properties based on device type (matching device_type_t enum)
-        if device_type == "leak_sensor":
-            # DEVICE_TYPE_LEAK_SENSOR = 4 - moisture device class
-            self._attr_device_class = BinarySensorDeviceClass.MOISTURE
-            self._attr_name = f"Gemns™ IoT Leak Sensor {self._get_professional_device_id()}"
-            self._attr_icon = "mdi:water"
-            
-        elif device_type == "vibration_sensor":
-            # DEVICE_TYPE_VIBRATION_MONITOR = 2 - vibration device class
-            self._attr_device_class = BinarySensorDeviceClass.VIBRATION
-            self._attr_name = f"Gemns™ IoT Vibration Monitor {self._get_professional_device_id()}"
-            self._attr_icon = "mdi:vibrate"
-            
-        elif device_type == "two_way_switch":
-            # DEVICE_TYPE_TWO_WAY_SWITCH = 3 - opening device class (on/off)
-            self._attr_device_class = BinarySensorDeviceClass.OPENING
-            self._attr_name = f"Gemns™ IoT Two-Way Switch {self._get_professional_device_id()}"
-            self._attr_icon = "mdi:toggle-switch"
-            
-        elif device_type in ["button", "legacy"]:
-            # DEVICE_TYPE_BUTTON = 1, DEVICE_TYPE_LEGACY = 0 - problem device class
-            self._attr_device_class = BinarySensorDeviceClass.PROBLEM
-            if device_type == "button":
-                self._attr_name = f"Gemns™ IoT Button {self._get_professional_device_id()}"
-                self._attr_icon = "mdi:gesture-tap-button"
-            else:  # legacy
-                self._attr_name = f"Gemns™ IoT Legacy Device {self._get_professional_device_id()}"
-                self._attr_icon = "mdi:chip"
-            
-        else:
-            # Unknown device type - generic binary sensor
-            self._attr_device_class = BinarySensorDeviceClass.PROBLEM
-            self._attr_name = f"Gemns™ IoT Alert {self._get_professional_device_id()}"
-            self._attr_icon = "mdi:alert"
+        device_class, name_prefix, icon = _SENSOR_SPEC.get(
+            self._device_type.lower(), _DEFAULT_SENSOR_SPEC
+        )
+        self._attr_device_class = device_class
+        device_id = professional_device_id(self.address, self.config_entry.entry_id)
+        self._attr_name = f"{name_prefix} {device_id}"
+        self._attr_icon = icon
 
     def _update_device_info(self) -> None:
         """Update device info with proper name and model."""
         device_type = self._device_type.lower()
         
-        # Set model based on device type (matching device_type_t enum)
-        model_map = {
-            "legacy": "Batteryless Legacy Device",           # DEVICE_TYPE_LEGACY = 0
-            "button": "Batteryless Button",                  # DEVICE_TYPE_BUTTON = 1  
-            "vibration_sensor": "Batteryless Vibration Monitor", # DEVICE_TYPE_VIBRATION_MONITOR = 2
-            "two_way_switch": "Batteryless Two-Way Switch",  # DEVICE_TYPE_TWO_WAY_SWITCH = 3
-            "leak_sensor": "Batteryless Leak Sensor",        # DEVICE_TYPE_LEAK_SENSOR = 4
-            "unknown_device": "Batteryless IoT Device"
-        }
-        
-        model = model_map.get(device_type, "IoT Sensor")
-        
-        # Set suggested area based on device type
-        area_map = {
-            "leak_sensor": "Kitchen",
-            "vibration_sensor": "Garage", 
-            "button": "Living Room",
-            "two_way_switch": "Bedroom",
-            "legacy": "Office"
-        }
-        suggested_area = area_map.get(device_type, "Home")
+        model = _MODEL_MAP.get(device_type, "IoT Sensor")
+        suggested_area = _AREA_MAP.get(device_type, "Home")
         
         # Set device image based on device type
         device_image = self._get_device_image(device_type)
@@ -274,90 +344,42 @@ class GemnsBLEBinarySensor(BinarySensorEntity):
         # Set device image if available
         if device_image:
             self._attr_device_info["image"] = device_image
-
-    def _get_professional_device_id(self) -> str:
-        """Generate a professional device identifier from MAC address."""
-        # Handle test/discovery addresses
-        if self.address.startswith("gemns_") or self.address == "00:00:00:00:00:00":
-            # For test devices, use entry ID to generate a consistent ID
-            entry_id = self.config_entry.entry_id
-            # Extract numbers from entry ID or use a hash
-            import hashlib
-            hash_obj = hashlib.md5(entry_id.encode())
-            hash_hex = hash_obj.hexdigest()
-            device_number = int(hash_hex[:3], 16) % 1000
-            return f"Test-{device_number:03d}"
-        
-        # Remove colons and get last 6 characters
-        clean_address = self.address.replace(":", "").upper()
-        last_6 = clean_address[-6:]
-        
-        # Convert to a more professional format
-        device_number = int(last_6, 16) % 1000  # Get a number between 0-999
-        return f"Unit-{device_number:03d}"
     
     def _get_device_image(self, device_type: str) -> str:
         """Get device image URL based on device type."""
-        # Map device types to their corresponding image paths
-        image_map = {
-            "leak_sensor": "/local/custom_components/gemns/static/icon.png",
-            "vibration_sensor": "/local/custom_components/gemns/static/icon.png", 
-            "two_way_switch": "/local/custom_components/gemns/static/icon.png",
-            "button": "/local/custom_components/gemns/static/icon.png",
-            "legacy": "/local/custom_components/gemns/static/icon.png",
-        }
-        
-        return image_map.get(device_type.lower(), "/local/custom_components/gemns/static/icon.png")
+        return _IMAGE_MAP.get(device_type.lower(), _DEFAULT_IMAGE)
             
     def _extract_binary_sensor_value(self, data: Dict[str, Any]) -> None:
         """Extract binary sensor value from coordinator data."""
-        _LOGGER.info("EXTRACTING BINARY SENSOR VALUE: %s | Data: %s", self.address, data)
-        
         # Try to get sensor value from sensor_data
         sensor_data = data.get("sensor_data", {})
-        _LOGGER.info("SENSOR DATA: %s | Sensor data: %s", self.address, sensor_data)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("SENSOR DATA: %s | Sensor data: %s", self.address, sensor_data)
         
-        if "leak_detected" in sensor_data:
-            # DEVICE_TYPE_LEAK_SENSOR = 4 - EVENT_TYPE_LEAK_DETECTED = 4
-            self._attr_is_on = sensor_data["leak_detected"]
-            _LOGGER.info("LEAK BINARY SENSOR: %s | Leak detected: %s | Value: %s", 
-                        self.address, sensor_data["leak_detected"], self._attr_is_on)
-            
-        elif "vibration_detected" in sensor_data:
-            # DEVICE_TYPE_VIBRATION_MONITOR = 2 - EVENT_TYPE_VIBRATION = 1
-            self._attr_is_on = sensor_data["vibration_detected"]
-            _LOGGER.info("VIBRATION BINARY SENSOR: %s | Vibration detected: %s | Value: %s", 
-                        self.address, sensor_data["vibration_detected"], self._attr_is_on)
-            
-        elif "switch_on" in sensor_data:
-            # DEVICE_TYPE_TWO_WAY_SWITCH = 3 - EVENT_TYPE_BUTTON_ON = 3
-            self._attr_is_on = sensor_data["switch_on"]
-            _LOGGER.info("SWITCH BINARY SENSOR: %s | Switch on: %s | Value: %s", 
-                        self.address, sensor_data["switch_on"], self._attr_is_on)
-            
-        elif "button_pressed" in sensor_data:
-            # DEVICE_TYPE_BUTTON = 1, DEVICE_TYPE_LEGACY = 0 - EVENT_TYPE_BUTTON_PRESS = 0
-            self._attr_is_on = sensor_data["button_pressed"]
-            _LOGGER.info("BUTTON BINARY SENSOR: %s | Button pressed: %s | Value: %s", 
-                        self.address, sensor_data["button_pressed"], self._attr_is_on)
-            
-        elif "sensor_event" in sensor_data:
-            # For other sensors, use sensor_event as binary state
-            self._attr_is_on = sensor_data["sensor_event"] > 0
-            _LOGGER.info("SENSOR EVENT BINARY: %s | Event: %s | Value: %s", 
-                        self.address, sensor_data["sensor_event"], self._attr_is_on)
-            
+        # First device-specific binary key present wins
+        for key in _BINARY_KEYS:
+            value = sensor_data.get(key)
+            if value is not None:
+                self._attr_is_on = bool(value)
+                if debug:
+                    _LOGGER.debug("BINARY SENSOR: %s | %s: %s | Value: %s",
+                                  self.address, key, value, self._attr_is_on)
+                return
+        
+        # For other sensors, use sensor_event as binary state
+        sensor_event = sensor_data.get("sensor_event")
+        if sensor_event is not None:
+            self._attr_is_on = sensor_event > 0
+            if debug:
+                _LOGGER.debug("SENSOR EVENT BINARY: %s | Event: %s | Value: %s", 
+                              self.address, sensor_event, self._attr_is_on)
+            return
+        
+        # No specific binary value found, default to False
+        self._attr_is_on = False
+        if "leak" in self._device_type.lower():
+            # For leak sensors without data, assume no leak
+            _LOGGER.debug("LEAK SENSOR DEFAULT: %s | No leak data, assuming no leak (False)", self.address)
         else:
-            # No specific binary value found, check if this is a leak sensor
-            if "leak" in self._device_type.lower():
-                # For leak sensors without data, assume no leak (False)
-                self._attr_is_on = False
-                _LOGGER.info("LEAK SENSOR DEFAULT: %s | No leak data, assuming no leak (False)", self.address)
-            else:
-                # For other sensors, default to False
-                self._attr_is_on = False
-                _LOGGER.warning("NO BINARY VALUE: %s | No leak detection or sensor event found", self.address)
-
-    async def async_update(self) -> None:
-        """Update binary sensor state."""
-        await self.coordinator.async_request_refresh()
+            _LOGGER.warning("NO BINARY VALUE: %s | No leak detection or sensor event found", self.address)
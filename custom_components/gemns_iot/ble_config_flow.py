@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import re
+from typing import Any, Final, NamedTuple
 
 from homeassistant.components.bluetooth import (
     BluetoothServiceInfo,
@@ -16,46 +17,104 @@ from homeassistant.core import HomeAssistant
 import voluptuous as vol
 
 from .const import DOMAIN, BLE_COMPANY_ID, CONF_DECRYPTION_KEY, CONF_DEVICE_NAME, CONF_DEVICE_TYPE
+from .packet_parser import GemnsPacket
+from .util import professional_device_id
 
 _LOGGER = logging.getLogger(__name__)
 
+_HEX_KEY_RE: Final = re.compile(r"[0-9a-fA-F]{32}")
+_GEMNS_NAME_RE: Final = re.compile(r"GEMN?S", re.IGNORECASE)
+
+# Device type choices offered for manual provisioning (device_type_t values)
+_DEVICE_TYPE_CHOICES: Final[dict[str, str]] = {
+    "1": "Button",
+    "2": "Vibration Monitor",
+    "3": "Two Way Switch",
+    "4": "Leak Sensor",
+}
+_DEVICE_TYPE_VALIDATOR: Final = vol.In(_DEVICE_TYPE_CHOICES)
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_NAME): str,
         vol.Required(CONF_ADDRESS): str,
         vol.Required(CONF_DECRYPTION_KEY): str,
         vol.Optional(CONF_DEVICE_NAME): str,
-        vol.Optional(CONF_DEVICE_TYPE, default=4): vol.In({
-            "1": "Button",
-            "2": "Vibration Monitor", 
-            "3": "Two Way Switch",
-            "4": "Leak Sensor"
-        }),
-    }
+        vol.Optional(CONF_DEVICE_TYPE, default=4): _DEVICE_TYPE_VALIDATOR,
+    },
+    extra=vol.PREVENT_EXTRA,
 )
 
 STEP_DISCOVERY_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_DECRYPTION_KEY): str,
         vol.Optional(CONF_DEVICE_NAME): str,
-        vol.Optional(CONF_DEVICE_TYPE, default=4): vol.In({
-            "1": "Button",
-            "2": "Vibration Monitor", 
-            "3": "Two Way Switch",
-            "4": "Leak Sensor"
-        }),
-    }
+        vol.Optional(CONF_DEVICE_TYPE, default=4): _DEVICE_TYPE_VALIDATOR,
+    },
+    extra=vol.PREVENT_EXTRA,
+)
+
+STEP_USER_CONFIG_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_DECRYPTION_KEY): str,
+    },
+    extra=vol.PREVENT_EXTRA,
 )
 
+# Packet device_type (index) -> (device type, display name)
+_DEVICE_TABLE: Final[tuple[tuple[str, str], ...]] = (
+    ("legacy", "Legacy Device"),
+    ("button", "Button"),
+    ("vibration_sensor", "Vibration Monitor"),
+    ("two_way_switch", "Two-Way Switch"),
+    ("leak_sensor", "Leak Sensor"),
+)
+
+# Name keyword -> (device type, display name) for beacons we cannot parse
+_NAME_TYPE_RE: Final = re.compile(
+    r"(?P<leak>leak)|(?P<vibration>vibration)|(?P<switch>switch)|(?P<button>button)",
+    re.IGNORECASE,
+)
+_NAME_TYPES: Final[dict[str, tuple[str, str]]] = {
+    "leak": ("leak_sensor", "Gemns™ IoT Leak Sensor"),
+    "vibration": ("vibration_sensor", "Gemns™ IoT Vibration Monitor"),
+    "switch": ("two_way_switch", "Gemns™ IoT Two-Way Switch"),
+    "button": ("button", "Gemns™ IoT Button"),
+}
+
+# Device type -> (packet device_type stored in the config entry, description, display type)
+_DEVICE_DISPATCH: Final[dict[str, tuple[int, str, str]]] = {
+    device_type: (index, description, device_type.replace("_", " ").title())
+    for device_type, (index, description) in {
+        "leak_sensor": (4, "Configure your Gemns™ IoT Leak Sensor. This device detects water leaks and moisture."),
+        "vibration_sensor": (2, "Configure your Gemns™ IoT Vibration Monitor. This device detects vibrations and movement."),
+        "two_way_switch": (3, "Configure your Gemns™ IoT Two-Way Switch. This device can be turned on/off remotely."),
+        "button": (1, "Configure your Gemns™ IoT Button. This device sends signals when pressed."),
+        "legacy": (0, "Configure your Gemns™ IoT Legacy Device. This device provides basic IoT functionality."),
+        "unknown": (4, "Configure your Gemns™ IoT Device. This device provides IoT functionality."),  # Default to leak sensor
+    }.items()
+}
+_UNKNOWN_DEVICE: Final = _DEVICE_DISPATCH["unknown"]
+
+class DiscoveredDevice(NamedTuple):
+    """Gemns™ IoT device seen during bluetooth discovery."""
+
+    discovery_info: BluetoothServiceInfo
+    device_type: str
+    device_name: str
+
 
 class GemnsBluetoothConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Gemns™ IoT BLE."""
 
     VERSION = 1
 
+    __slots__ = ("_discovered_devices", "_selected_device")
+
     def __init__(self) -> None:
         """Initialize the config flow."""
-        self._discovered_devices: dict[str, BluetoothServiceInfo] = {}
+        self._discovered_devices: dict[str, DiscoveredDevice] = {}
+        self._selected_device: DiscoveredDevice | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -68,36 +127,22 @@ class GemnsBluetoothConfigFlow(ConfigFlow, domain=DOMAIN):
             device_name = user_input.get(CONF_DEVICE_NAME, name)
             device_type = int(user_input.get(CONF_DEVICE_TYPE, "4"))  # Convert string to int, default to leak sensor
             
-            # Validate decryption key format
-            try:
-                bytes.fromhex(decryption_key)
-                if len(decryption_key) != 32:  # 16 bytes = 32 hex chars
-                    return self.async_show_form(
-                        step_id="user",
-                        data_schema=STEP_USER_DATA_SCHEMA,
-                        errors={"base": "invalid_decryption_key_length"},
-                    )
-            except ValueError:
+            # Validate decryption key format (16 bytes = 32 hex chars)
+            if len(decryption_key) != 32:
+                return self.async_show_form(
+                    step_id="user",
+                    data_schema=STEP_USER_DATA_SCHEMA,
+                    errors={"base": "invalid_decryption_key_length"},
+                )
+            if _HEX_KEY_RE.fullmatch(decryption_key) is None:
                 return self.async_show_form(
                     step_id="user",
                     data_schema=STEP_USER_DATA_SCHEMA,
                     errors={"base": "invalid_decryption_key_format"},
                 )
             
-            # Check if already configured
-            await self.async_set_unique_id(address)
-            self._abort_if_unique_id_configured()
-            
-            # Create the config entry
-            return self.async_create_entry(
-                title=device_name,
-                data={
-                    CONF_NAME: name,
-                    CONF_ADDRESS: address,
-                    CONF_DECRYPTION_KEY: decryption_key,
-                    CONF_DEVICE_NAME: device_name,
-                    CONF_DEVICE_TYPE: device_type,
-                },
+            return await self._async_create_entry(
+                address, name, decryption_key, device_name, device_type
             )
 
         return self.async_show_form(
@@ -114,9 +159,10 @@ class GemnsBluetoothConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle the bluetooth discovery step - but we don't auto-configure."""
         # We don't auto-configure devices anymore, just show them as available
-        await self.async_set_unique_id(discovery_info.address)
+        address = discovery_info.address
+        await self.async_set_unique_id(address)
         self._abort_if_unique_id_configured()
-        
+
         # Check if this looks like a Gemns™ IoT device
         if not self._is_gems_device(discovery_info):
             return self.async_abort(reason="not_supported")
@@ -125,11 +171,9 @@ class GemnsBluetoothConfigFlow(ConfigFlow, domain=DOMAIN):
         device_type, device_name = self._extract_device_info_from_beacon(discovery_info)
         
         # Store the device info with extracted type
-        self._discovered_devices[discovery_info.address] = {
-            "discovery_info": discovery_info,
-            "device_type": device_type,
-            "device_name": device_name
-        }
+        self._discovered_devices[address] = DiscoveredDevice(
+            discovery_info, device_type, device_name
+        )
         
         return self.async_abort(reason="device_selection_required")
 
@@ -139,35 +183,14 @@ class GemnsBluetoothConfigFlow(ConfigFlow, domain=DOMAIN):
         """Handle device selection step."""
         if user_input is None:
             # Show discovered devices
-            devices = []
-            for address, device_info in self._discovered_devices.items():
-                device_type = device_info.get("device_type", "unknown")
-                device_name = device_info.get("device_name", "Gemns™ IoT Device")
-                
-                # Add device type icon
-                icon_map = {
-                    "leak_sensor": "mdi:water",
-                    "vibration_sensor": "mdi:vibrate", 
-                    "two_way_switch": "mdi:toggle-switch",
-                    "button": "mdi:gesture-tap-button",
-                    "legacy": "mdi:chip",
-                    "unknown": "mdi:chip"
-                }
-                
-                devices.append({
-                    "value": address,
-                    "label": f"{device_name} ({address})",
-                    "icon": icon_map.get(device_type, "mdi:chip")
-                })
+            options = {
+                address: f"{device_info.device_name} ({address})"
+                for address, device_info in self._discovered_devices.items()
+            }
             
             return self.async_show_form(
                 step_id="device_selection",
-                data_schema=vol.Schema({
-                    vol.Required("device"): vol.In({
-                        device["value"]: device["label"] 
-                        for device in devices
-                    })
-                }),
+                data_schema=vol.Schema({vol.Required("device"): vol.In(options)}),
                 description_placeholders={
                     "message": "Select the Gemns™ IoT device you want to configure:"
                 }
@@ -187,53 +210,25 @@ class GemnsBluetoothConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle user configuration step with device-specific info."""
         if user_input is None:
-            device_info = self._selected_device
-            device_type = device_info.get("device_type", "unknown")
-            device_name = device_info.get("device_name", "Gemns™ IoT Device")
-            
-            # Create device-specific schema
-            schema = {
-                vol.Required(CONF_DECRYPTION_KEY): str,
-            }
-            
-            # Add device-specific description
-            descriptions = {
-                "leak_sensor": "Configure your Gemns™ IoT Leak Sensor. This device detects water leaks and moisture.",
-                "vibration_sensor": "Configure your Gemns™ IoT Vibration Monitor. This device detects vibrations and movement.",
-                "two_way_switch": "Configure your Gemns™ IoT Two-Way Switch. This device can be turned on/off remotely.",
-                "button": "Configure your Gemns™ IoT Button. This device sends signals when pressed.",
-                "legacy": "Configure your Gemns™ IoT Legacy Device. This device provides basic IoT functionality.",
-                "unknown": "Configure your Gemns™ IoT Device. This device provides IoT functionality."
-            }
+            _, description, display_type = _DEVICE_DISPATCH.get(
+                self._selected_device.device_type, _UNKNOWN_DEVICE
+            )
             
             return self.async_show_form(
                 step_id="user_config",
-                data_schema=vol.Schema(schema),
+                data_schema=STEP_USER_CONFIG_DATA_SCHEMA,
                 description_placeholders={
-                    "message": descriptions.get(device_type, descriptions["unknown"]),
-                    "device_name": device_name,
-                    "device_type": device_type.replace("_", " ").title(),
+                    "message": description,
+                    "device_name": self._selected_device.device_name,
+                    "device_type": display_type,
                     "integration_icon": "/local/custom_components/gemns/static/icon.png"
                 }
             )
         
         # Configuration complete
-        device_info = self._selected_device
-        discovery_info = device_info["discovery_info"]
-        device_type = device_info.get("device_type", "unknown")
-        device_name = device_info.get("device_name", "Gemns™ IoT Device")
-        
-        # Map device type to sensor type
-        device_type_map = {
-            "legacy": 0,
-            "button": 1,
-            "vibration_sensor": 2,
-            "two_way_switch": 3,
-            "leak_sensor": 4,
-            "unknown": 4  # Default to leak sensor
-        }
+        discovery_info, device_type, device_name = self._selected_device
         
-        device_type = device_type_map.get(device_type, 4)
+        device_type, _, _ = _DEVICE_DISPATCH.get(device_type, _UNKNOWN_DEVICE)
         
         # Create the config entry
         return self.async_create_entry(
@@ -250,74 +245,83 @@ class GemnsBluetoothConfigFlow(ConfigFlow, domain=DOMAIN):
     def _is_gems_device(self, discovery_info: BluetoothServiceInfo) -> bool:
         """Check if this is a Gemns™ IoT device using new packet format."""
         # Check manufacturer data for new Company ID
-        if discovery_info.manufacturer_data:
-            for manufacturer_id, data in discovery_info.manufacturer_data.items():
-                if manufacturer_id == BLE_COMPANY_ID and len(data) >= 20:
-                    return True
+        manufacturer_data = discovery_info.manufacturer_data
+        if manufacturer_data:
+            data = manufacturer_data.get(BLE_COMPANY_ID)
+            if data is not None and len(data) >= 20:
+                return True
         
         # Check name patterns as fallback
-        name = discovery_info.name or ""
-        if any(pattern in name.upper() for pattern in ["GEMNS", "GEMS"]):
-            return True
-        
-        return False
+        name = discovery_info.name
+        return name is not None and _GEMNS_NAME_RE.search(name) is not None
     
     def _extract_device_info_from_beacon(self, discovery_info: BluetoothServiceInfo) -> tuple[str, str]:
         """Extract device type and name from beacon data."""
         try:
             # Try to parse manufacturer data to get device type
-            if discovery_info.manufacturer_data:
-                for manufacturer_id, data in discovery_info.manufacturer_data.items():
-                    if manufacturer_id == BLE_COMPANY_ID and len(data) >= 20:
-                        # Try to parse the packet to get device type
-                        try:
-                            from .packet_parser import GemnsPacket
-                            packet = GemnsPacket(data)
-                            if packet.is_valid():
-                                device_type = packet.device_type
-                                
-                                # Map sensor type to device type and name
-                                device_type_map = {
-                                    0: ("legacy", "Legacy Device"),
-                                    1: ("button", "Button"),
-                                    2: ("vibration_sensor", "Vibration Monitor"),
-                                    3: ("two_way_switch", "Two-Way Switch"),
-                                    4: ("leak_sensor", "Leak Sensor"),
-                                }
-                                
-                                device_type, device_name = device_type_map.get(device_type, ("unknown", "IoT Device"))
-                                
-                                # Generate professional device name
-                                short_address = discovery_info.address.replace(":", "")[-6:].upper()
-                                device_number = int(short_address, 16) % 1000
-                                professional_name = f"Gemns™ IoT {device_name} Unit-{device_number:03d}"
-                                
-                                return device_type, professional_name
-                        except Exception as e:
-                            print(f"Error parsing beacon data: {e}")
-                            pass
+            data = (discovery_info.manufacturer_data or {}).get(BLE_COMPANY_ID)
+            if data is not None and len(data) >= 20:
+                # Try to parse the packet to get device type
+                try:
+                    packet = GemnsPacket(data)
+                    if packet.is_valid():
+                        device_type = packet.device_type
+                        
+                        device_type, device_name = (
+                            _DEVICE_TABLE[device_type]
+                            if 0 <= device_type < len(_DEVICE_TABLE)
+                            else ("unknown", "IoT Device")
+                        )
+                        
+                        return device_type, f"Gemns™ IoT {device_name} {professional_device_id(discovery_info.address)}"
+                except Exception as e:
+                    _LOGGER.debug("Error parsing beacon data: %s", e)
             
             # Fallback: use device name or generate generic name
-            device_name = discovery_info.name or "Gemns™ IoT Device"
-            if "Gemns" in device_name:
-                # Try to extract device type from name
-                if "Leak" in device_name or "leak" in device_name:
-                    return "leak_sensor", "Gemns™ IoT Leak Sensor"
-                elif "Vibration" in device_name or "vibration" in device_name:
-                    return "vibration_sensor", "Gemns™ IoT Vibration Monitor"
-                elif "Switch" in device_name or "switch" in device_name:
-                    return "two_way_switch", "Gemns™ IoT Two-Way Switch"
-                elif "Button" in device_name or "button" in device_name:
-                    return "button", "Gemns™ IoT Button"
+            match = _NAME_TYPE_RE.search(discovery_info.name or "")
+            if match is not None:
+                return _NAME_TYPES[match.lastgroup]
             
             # Default fallback
             return "unknown", "Gemns™ IoT Device"
             
         except Exception as e:
-            print(f"Error extracting device info: {e}")
+            _LOGGER.debug("Error extracting device info: %s", e)
             return "unknown", "Gemns™ IoT Device"
 
     async def async_step_import(self, import_data: dict[str, Any]) -> FlowResult:
         """Handle import from configuration.yaml."""
-        return await self.async_step_user(import_data)
+        # Imported data is trusted; skip the interactive key validation
+        name = import_data[CONF_NAME]
+        return await self._async_create_entry(
+            import_data[CONF_ADDRESS].upper(),
+            name,
+            import_data[CONF_DECRYPTION_KEY],
+            import_data.get(CONF_DEVICE_NAME, name),
+            int(import_data.get(CONF_DEVICE_TYPE, 4)),
+        )
+
+    async def _async_create_entry(
+        self,
+        address: str,
+        name: str,
+        decryption_key: str,
+        device_name: str,
+        device_type: int,
+    ) -> FlowResult:
+        """Create the config entry for a provisioned device."""
+        # Check if already configured
+        await self.async_set_unique_id(address)
+        self._abort_if_unique_id_configured()
+        
+        return self.async_create_entry(
+            title=device_name,
+            data={
+                CONF_NAME: name,
+                CONF_ADDRESS: address,
+                CONF_DECRYPTION_KEY: decryption_key,
+                CONF_DEVICE_NAME: device_name,
+                CONF_DEVICE_TYPE: device_type,
+            },
+        )
 
@@ -4,38 +4,208 @@ from __future__ import annotations
 
 import asyncio
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
+import re
 import struct
+import time
 from typing import Any
 
 from homeassistant.components.bluetooth import (
+    BluetoothCallbackMatcher,
     BluetoothChange,
     BluetoothScanningMode,
     BluetoothServiceInfo,
     BluetoothServiceInfoBleak,
     async_discovered_service_info,
     async_last_service_info,
+    async_register_callback,
 )
 from homeassistant.components.bluetooth.passive_update_coordinator import (
     PassiveBluetoothDataUpdateCoordinator,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_track_time_interval
 
 from .const import BLE_COMPANY_ID, CONF_ADDRESS, CONF_DECRYPTION_KEY
 from .packet_parser import parse_gems_packet
+from .util import professional_device_id
 
 _LOGGER = logging.getLogger(__name__)
 
 FALLBACK_POLL_INTERVAL = timedelta(seconds=10)
 
+# Flags (1) + Encrypted Data (16) + CRC (1), company ID already stripped by HA.
+# The encrypted block is skipped here; parse_gems_packet decodes it.
+_GEMS_HEADER = struct.Struct("<B16xB")
+_ENCRYPTED_DATA_SIZE = 16
+
+# Values promoted from the parsed packet to the top level of the result
+_DECRYPTED_FIELDS = ("firmware_version",)
+_SENSOR_FIELDS = ("leak_detected", "event_counter", "sensor_event")
+# Result values stored as item tuples in the decode cache
+_NESTED_FIELDS = frozenset({"packet_structure", "decrypted_data", "sensor_data"})
+
+_GEMNS_NAME_RE = re.compile(r"GEMN?S", re.IGNORECASE)
+
+# Sensor device_type (device_type_t) -> (device type, name label)
+_DEVICE_TYPES: dict[int, tuple[str, str]] = {
+    1: ("button", "Button"),
+    2: ("vibration_sensor", "Vibration Monitor"),
+    3: ("two_way_switch", "Two Way Switch"),
+    4: ("leak_sensor", "Leak Sensor"),
+    5: ("vibration_sensor", "Vibration Sensor"),
+    6: ("on_off_switch", "On/Off Switch"),
+    7: ("light_switch", "Light Switch"),
+    8: ("door_switch", "Door Switch"),
+    9: ("toggle_switch", "Toggle Switch"),
+}
+
+# Fixed-shape advertisement data; copied and filled in for every advertisement.
+# Mutable values (sensor_data) must be assigned fresh after copying.
+_BASE_DATA: dict[str, Any] = {
+    "address": None,
+    "name": None,
+    "rssi": None,
+    "timestamp": None,
+    "device_type": "unknown",
+    "sensor_data": None,
+    "battery_level": None,
+    "signal_strength": None,
+}
+
+# Simulated leak sensor data used in test mode; nested values are shared
+# between copies and must be treated as read-only.
+_TEST_PACKET_TEMPLATE: dict[str, Any] = {
+    "address": None,
+    "name": "Gemns™ IoT Test Device Unit-001",
+    "rssi": -50,
+    "timestamp": None,
+    "device_type": "leak_sensor",
+    "sensor_data": {
+        "device_type": 4,  # Leak sensor
+        "leak_detected": False,
+        "event_counter": 1
+    },
+    "battery_level": None,
+    "signal_strength": -50,
+    "firmware_version": "1.0",  # This simulates the parsed firmware version
+    "decrypted_data": {
+        "src_id": 12345,
+        "nwk_id": 6789,
+        "fw_version": 16,  # Raw firmware byte (16 = 0x10)
+        "firmware_version": "1.0",  # Parsed firmware version
+        "device_type": b'\x00\x04',  # Leak sensor
+        "payload": b'\x00\x00\x00\x00\x00\x00\x00\x00',
+        "event_counter_lsb": 1,
+        "payload_length": 0,
+        "encrypt_status": 1,
+        "power_status": 0,
+    }
+}
+
+
+@lru_cache(maxsize=64)
+def _default_name(address: str) -> str:
+    """Return the fallback name for a device that advertises without one."""
+    return f"Gemns™ IoT Device {professional_device_id(address)}"
+
+
+@lru_cache(maxsize=64)
+def _device_identity(address: str, device_type: int) -> tuple[str, str] | None:
+    """Return (device type, name) for a sensor device_type seen at an address."""
+    entry = _DEVICE_TYPES.get(device_type)
+    if entry is None:
+        return None
+    type_name, label = entry
+    return type_name, f"Gemns™ IoT {label} {professional_device_id(address)}"
+
+
+# Devices re-advertise the same frame many times; identical bytes decode to the
+# same result, so repeats skip CRC and AES. The cached value is an immutable
+# tuple of items (nested dicts as item tuples) so callers can't corrupt it;
+# failures raise ValueError and are therefore not cached.
+@lru_cache(maxsize=256)
+def _decode_gems_frame(data: bytes, decryption_key: bytes | None) -> tuple[tuple[str, Any], ...]:
+    """Decode a Gemns™ IoT manufacturer data frame into result items."""
+    # Parse packet structure: HA BLE driver filters out Company ID (2 bytes)
+    # So we receive: Flags (1) + Encrypted Data (16) + CRC (1) = 18 bytes
+    if len(data) < _GEMS_HEADER.size:
+        raise ValueError(f"invalid packet length: {len(data)} bytes (expected {_GEMS_HEADER.size})")
+
+    # Company ID is already filtered by HA BLE driver (0x0F9C)
+    company_id = 0x0F9C  # Gemns™ IoT company ID (filtered by HA)
+    flags, crc = _GEMS_HEADER.unpack_from(data)
+
+    # Parse the full 18-byte packet using the parser
+    parsed_packet = parse_gems_packet(data, decryption_key)
+
+    if not parsed_packet:
+        raise ValueError("packet parser returned empty result")
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("GEMNS™ IOT PACKET: Raw=%s | Parsed=%s", data.hex(), parsed_packet)
+
+    decrypted_data = parsed_packet.get("decrypted_data")
+    sensor_data = parsed_packet.get("sensor_data")
+
+    result: list[tuple[str, Any]] = [
+        ("company_id", company_id),
+        ("flags", flags),
+        ("crc", crc),
+        ("packet_structure", (
+            ("company_id", company_id),
+            ("flags", flags),
+            ("encrypted_data_length", _ENCRYPTED_DATA_SIZE),
+            ("crc", crc),
+        )),
+    ]
+
+    # Add decrypted data and firmware version if available
+    if decrypted_data:
+        result.append(("decrypted_data", tuple(decrypted_data.items())))
+        for key in _DECRYPTED_FIELDS:
+            if key in decrypted_data:
+                result.append((key, decrypted_data[key]))
+
+    # Add sensor data and the specific sensor values if available
+    if sensor_data:
+        result.append(("sensor_data", tuple(sensor_data.items())))
+        for key in _SENSOR_FIELDS:
+            if key in sensor_data:
+                result.append((key, sensor_data[key]))
+
+    return tuple(result)
+
+
+def _parse_gems_manufacturer_data(data: bytes, decryption_key: bytes | None) -> dict[str, Any]:
+    """Parse Gemns™ IoT manufacturer data using 18-byte packet format."""
+    try:
+        items = _decode_gems_frame(data, decryption_key)
+    except ValueError as err:
+        _LOGGER.warning("GEMNS™ IOT PACKET REJECTED: %s", err)
+        return {}
+    # Fresh dicts per call, including the nested ones
+    return {
+        key: dict(value) if key in _NESTED_FIELDS else value
+        for key, value in items
+    }
+
 
 class GemnsBluetoothProcessorCoordinator(
     PassiveBluetoothDataUpdateCoordinator
 ):
     """Coordinator for Gemns™ IoT Bluetooth devices."""
 
+    __slots__ = (
+        "_entry",
+        "_decryption_key",
+        "_cancel_discovery",
+        "_listener_update_handle",
+        "_last_manufacturer_data",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -67,6 +237,34 @@ class GemnsBluetoothProcessorCoordinator(
         )
         self.data = {}
         self.last_update_success = True
+        self._decryption_key = self._load_decryption_key()
+        self._cancel_discovery: CALLBACK_TYPE | None = None
+        self._listener_update_handle: asyncio.Handle | None = None
+        self._last_manufacturer_data: bytes | None = None
+        entry.async_on_unload(self._async_cancel_discovery)
+        entry.async_on_unload(self._async_cancel_listener_update)
+        entry.async_on_unload(entry.add_update_listener(self._async_entry_updated))
+
+    def _load_decryption_key(self) -> bytes | None:
+        """Decode the decryption key from the config entry once."""
+        hex_key = self._entry.data.get(CONF_DECRYPTION_KEY)
+        if hex_key is None:
+            _LOGGER.warning("NO DECRYPTION KEY FOUND in config entry")
+            return None
+        try:
+            return bytes.fromhex(hex_key)
+        except ValueError:
+            _LOGGER.error("INVALID DECRYPTION KEY FORMAT: %s", hex_key)
+            return None
+
+    async def _async_entry_updated(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Pick up a changed decryption key from the config entry."""
+        decryption_key = self._load_decryption_key()
+        if decryption_key != self._decryption_key:
+            _LOGGER.info("Decryption key changed for %s", self.address)
+            self._decryption_key = decryption_key
+            # Force the next advertisement to be decoded with the new key
+            self._last_manufacturer_data = None
 
     async def async_init(self) -> None:
         """Initialize the coordinator."""
@@ -114,6 +312,14 @@ class GemnsBluetoothProcessorCoordinator(
         # Always available - just track if we have recent data
         return True
 
+    @property
+    def last_seen(self) -> str | None:
+        """Return when the last advertisement was parsed, as ISO string."""
+        timestamp = self.data.get("timestamp") if self.data else None
+        if timestamp is None:
+            return None
+        return datetime.fromtimestamp(timestamp).isoformat()
+
     @callback
     def _async_handle_bluetooth_event(
         self,
@@ -121,217 +327,117 @@ class GemnsBluetoothProcessorCoordinator(
         change: BluetoothChange,
     ) -> None:
         """Handle a Bluetooth event."""
-        super()._async_handle_bluetooth_event(service_info, change)
-        try:
-            _LOGGER.info("BLE EVENT: %s | RSSI: %s | Name: %s | Change: %s",
-                        self.address, service_info.rssi, service_info.name, change)
-
+        # The base handler only marks the device available and notifies
+        # listeners; notify once through the coalesced flush instead, after
+        # self.data has been updated
+        self._available = True
+        manufacturer_data = (
+            service_info.manufacturer_data.get(BLE_COMPANY_ID)
+            if service_info.manufacturer_data
+            else None
+        )
+        if (
+            self.data
+            and manufacturer_data is not None
+            and manufacturer_data == self._last_manufacturer_data
+        ):
+            # Same frame re-advertised: only signal and timestamp changed
+            parsed_data = {
+                **self.data,
+                "rssi": service_info.rssi,
+                "signal_strength": service_info.rssi,
+                "timestamp": time.time(),
+            }
+        else:
             # Parse the advertisement data and update our data
-            parsed_data = self._parse_advertisement_data(service_info)
-            self.data = parsed_data
-            self.last_update_success = True
+            try:
+                parsed_data = self._parse_advertisement_data(service_info)
+            except (ValueError, KeyError) as e:
+                # e.g. an address that isn't a hex MAC can't yield a device ID
+                self._last_manufacturer_data = None
+                self.last_update_success = False
+                _LOGGER.error("BLE PARSE ERROR: %s | Error: %s", self.address, e)
+                return
+            self._last_manufacturer_data = manufacturer_data
+        self.data = parsed_data
+        self.last_update_success = True
 
-            _LOGGER.info("BLE DATA PARSED: %s | Data: %s", self.address, parsed_data)
-            self.async_update_listeners()
+        _LOGGER.debug("GEMNS™ IOT EVENT: %s | RSSI: %s | FW: %s | Type: %s",
+                      self.address, service_info.rssi,
+                      parsed_data.get("firmware_version"), parsed_data["device_type"])
+        self._async_schedule_listener_update()
 
-        except (ValueError, KeyError, AttributeError, TypeError) as e:
-            self.last_update_success = False
-            _LOGGER.error("BLE PARSE ERROR: %s | Error: %s", self.address, e)
+    @callback
+    def _async_schedule_listener_update(self) -> None:
+        """Notify listeners once per loop iteration for a burst of advertisements."""
+        if self._listener_update_handle is not None:
+            return
+        self._listener_update_handle = self.hass.loop.call_soon(
+            self._async_flush_listener_update
+        )
+
+    @callback
+    def _async_flush_listener_update(self) -> None:
+        """Notify listeners with the latest parsed advertisement."""
+        self._listener_update_handle = None
+        self.async_update_listeners()
+
+    @callback
+    def _async_cancel_listener_update(self) -> None:
+        """Cancel a pending coalesced listener update."""
+        if self._listener_update_handle is not None:
+            self._listener_update_handle.cancel()
+            self._listener_update_handle = None
 
     def _parse_advertisement_data(self, service_info: BluetoothServiceInfo) -> dict[str, Any]:
         """Parse Gemns™ IoT advertisement data using new packet format."""
-        # Get professional device ID
-        clean_address = service_info.address.replace(":", "").upper()
-        last_6 = clean_address[-6:]
-        device_number = int(last_6, 16) % 1000  # Get a number between 0-999
-        professional_id = f"Unit-{device_number:03d}"
-
-        data = {
-            "address": service_info.address,
-            "name": service_info.name or f"Gemns™ IoT Device {professional_id}",
-            "rssi": service_info.rssi,
-            "timestamp": datetime.now().isoformat(),
-            "device_type": "unknown",
-            "sensor_data": {},
-            "battery_level": None,
-            "signal_strength": service_info.rssi,
-        }
+        address = service_info.address
+        manufacturer_map = service_info.manufacturer_data
+
+        data = _BASE_DATA.copy()
+        data["address"] = address
+        data["name"] = service_info.name or _default_name(address)
+        data["rssi"] = data["signal_strength"] = service_info.rssi
+        data["timestamp"] = time.time()
+        data["sensor_data"] = {}
 
         # Parse manufacturer data for Gemns™ IoT devices using new packet format
-        if service_info.manufacturer_data:
-            _LOGGER.info("MANUFACTURER DATA: %s | IDs: %s", self.address, list(service_info.manufacturer_data.keys()))
-            for manufacturer_id, manufacturer_data in service_info.manufacturer_data.items():
-                _LOGGER.info("MANUFACTURER: %s | ID: 0x%04X | Data: %s",
-                            self.address, manufacturer_id, manufacturer_data.hex())
-                if manufacturer_id == BLE_COMPANY_ID:  # Gemns™ IoT manufacturer ID (0x0F9C)
-                    _LOGGER.info("GEMNS™ IOT DEVICE DETECTED: %s | Parsing data...", self.address)
-                    parsed_data = self._parse_gems_manufacturer_data(manufacturer_data)
-                    if parsed_data:
-                        data.update(parsed_data)
-                        _LOGGER.info("GEMNS™ IOT DATA PARSED: %s | Result: %s", self.address, parsed_data)
-                        _LOGGER.info("FIRMWARE VERSION CHECK: %s | firmware_version in data: %s", self.address, data.get("firmware_version"))
-                    else:
-                        _LOGGER.warning("GEMNS™ IOT PARSE FAILED: %s | Data: %s", self.address, manufacturer_data.hex())
+        if manufacturer_map:
+            manufacturer_data = manufacturer_map.get(BLE_COMPANY_ID)
+            if manufacturer_data is not None:  # Gemns™ IoT manufacturer ID (0x0F9C)
+                parsed_data = _parse_gems_manufacturer_data(bytes(manufacturer_data), self._decryption_key)
+                if parsed_data:
+                    data.update(parsed_data)
                 else:
-                    _LOGGER.debug("NON-GEMNS™ IOT: %s | ID: 0x%04X", self.address, manufacturer_id)
+                    _LOGGER.warning("GEMNS™ IOT PARSE FAILED: %s | Data: %s", self.address, manufacturer_data.hex())
+            else:
+                _LOGGER.debug("NON-GEMNS™ IOT: %s | IDs: %s", self.address, manufacturer_map.keys())
         else:
             _LOGGER.warning("NO MANUFACTURER DATA: %s", self.address)
 
         # Determine device type based on sensor type
-        if 'sensor_data' in data and 'device_type' in data['sensor_data']:
-            device_type = data['sensor_data']['device_type']
-            _LOGGER.info("DEVICE TYPE DETECTION: device_type=%d (0x%04X)", device_type, device_type)
-            if device_type == 1:
-                data["device_type"] = "button"
-                data["name"] = f"Gemns™ IoT Button {professional_id}"
-                _LOGGER.info("  Identified as: button")
-            elif device_type == 2:
-                data["device_type"] = "vibration_sensor"
-                data["name"] = f"Gemns™ IoT Vibration Monitor {professional_id}"
-                _LOGGER.info("  Identified as: vibration_sensor")
-            elif device_type == 3:
-                data["device_type"] = "two_way_switch"
-                data["name"] = f"Gemns™ IoT Two Way Switch {professional_id}"
-                _LOGGER.info("  Identified as: two_way_switch")
-            elif device_type == 4:
-                data["device_type"] = "leak_sensor"
-                data["name"] = f"Gemns™ IoT Leak Sensor {professional_id}"
-                _LOGGER.info("  Identified as: leak_sensor")
-            elif device_type == 5:
-                data["device_type"] = "vibration_sensor"
-                data["name"] = f"Gemns™ IoT Vibration Sensor {professional_id}"
-                _LOGGER.info("  Identified as: vibration_sensor")
-            elif device_type == 6:
-                data["device_type"] = "on_off_switch"
-                data["name"] = f"Gemns™ IoT On/Off Switch {professional_id}"
-                _LOGGER.info("  Identified as: on_off_switch")
-            elif device_type == 7:
-                data["device_type"] = "light_switch"
-                data["name"] = f"Gemns™ IoT Light Switch {professional_id}"
-                _LOGGER.info("  Identified as: light_switch")
-            elif device_type == 8:
-                data["device_type"] = "door_switch"
-                data["name"] = f"Gemns™ IoT Door Switch {professional_id}"
-                _LOGGER.info("  Identified as: door_switch")
-            elif device_type == 9:
-                data["device_type"] = "toggle_switch"
-                data["name"] = f"Gemns™ IoT Toggle Switch {professional_id}"
-                _LOGGER.info("  Identified as: toggle_switch")
+        device_type = data["sensor_data"].get("device_type")
+        if device_type is not None:
+            identity = _device_identity(address, device_type)
+            if identity is not None:
+                data["device_type"], data["name"] = identity
             else:
-                _LOGGER.warning("  Unknown device type: %d (0x%04X)", device_type, device_type)
+                _LOGGER.warning("Unknown device type: %d (0x%04X)", device_type, device_type)
 
-        _LOGGER.info("FINAL DATA CHECK: %s | firmware_version: %s", self.address, data.get("firmware_version"))
         return data
 
-    def _parse_gems_manufacturer_data(self, data: bytes) -> dict[str, Any]:
-        """Parse Gemns™ IoT manufacturer data using 18-byte packet format."""
-        _LOGGER.info("PARSING GEMNS DATA: Length=%d | Data=%s", len(data), data.hex())
-
-        if len(data) < 18:  # Gemns™ IoT packet format is 18 bytes
-            _LOGGER.warning("INVALID PACKET LENGTH: %d bytes (expected 18)", len(data))
-            return {}
-
-        # Parse packet structure: HA BLE driver filters out Company ID (2 bytes)
-        # So we receive: Flags (1) + Encrypted Data (16) + CRC (1) = 18 bytes
-        if len(data) < 18:
-            _LOGGER.error("PACKET TOO SHORT: %d bytes (need 18)", len(data))
-            return {}
-
-        _LOGGER.info("PACKET DEBUG: Length=%d, Data=%s", len(data), data.hex())
-
-        try:
-            # Company ID is already filtered by HA BLE driver (0x0F9C)
-            company_id = 0x0F9C  # Gemns™ IoT company ID (filtered by HA)
-            flags = data[0]  # 1 byte
-            encrypted_data = data[1:17]  # 16 bytes (positions 1-16)
-            crc = data[17]  # 1 byte (position 17, last byte)
-
-            _LOGGER.info("PACKET STRUCTURE: Company ID=0x%04X (filtered by HA), Flags=0x%02X, CRC=0x%02X",
-                        company_id, flags, crc)
-            _LOGGER.info("ENCRYPTED DATA (%d bytes): %s", len(encrypted_data), encrypted_data.hex())
-
-        except (IndexError, struct.error) as e:
-            _LOGGER.error("PACKET PARSING ERROR: %s", e)
-            return {}
-
-        # Get decryption key from config entry
-        decryption_key = None
-        if hasattr(self._entry, 'data') and CONF_DECRYPTION_KEY in self._entry.data:
-            try:
-                decryption_key = bytes.fromhex(self._entry.data[CONF_DECRYPTION_KEY])
-                _LOGGER.info("DECRYPTION KEY: %s", self._entry.data[CONF_DECRYPTION_KEY])
-            except ValueError:
-                _LOGGER.error("INVALID DECRYPTION KEY FORMAT: %s", self._entry.data[CONF_DECRYPTION_KEY])
-        else:
-            _LOGGER.warning("NO DECRYPTION KEY FOUND in config entry")
-
-        # Parse the full 18-byte packet using the parser
-        _LOGGER.info("CALLING PACKET PARSER: packet_data=%s, key=%s",
-                    data.hex(), decryption_key.hex() if decryption_key else "None")
-
-        parsed_packet = parse_gems_packet(data, decryption_key)
-
-        if not parsed_packet:
-            _LOGGER.error("PACKET PARSER RETURNED EMPTY RESULT")
-            return {}
-
-        _LOGGER.info("PACKET PARSED SUCCESSFULLY: %s", parsed_packet)
-
-        result = {
-            "company_id": company_id,
-            "flags": flags,
-            "crc": crc,
-            "packet_structure": {
-                "company_id": company_id,
-                "flags": flags,
-                "encrypted_data_length": len(encrypted_data),
-                "crc": crc,
-            }
-        }
-
-        # Add decrypted data if available
-        if 'decrypted_data' in parsed_packet:
-            result['decrypted_data'] = parsed_packet['decrypted_data']
-            _LOGGER.info("DECRYPTED DATA: %s", parsed_packet['decrypted_data'])
-
-            # Extract firmware version from decrypted data
-            decrypted_data = parsed_packet['decrypted_data']
-            if 'firmware_version' in decrypted_data:
-                result['firmware_version'] = decrypted_data['firmware_version']
-                _LOGGER.info("FIRMWARE VERSION: %s", decrypted_data['firmware_version'])
-
-        # Add sensor data if available
-        if 'sensor_data' in parsed_packet:
-            result['sensor_data'] = parsed_packet['sensor_data']
-            _LOGGER.info("SENSOR DATA: %s", parsed_packet['sensor_data'])
-
-            # Extract specific sensor values
-            sensor_data = parsed_packet['sensor_data']
-            if 'leak_detected' in sensor_data:
-                result['leak_detected'] = sensor_data['leak_detected']
-                _LOGGER.info("LEAK DETECTED: %s", sensor_data['leak_detected'])
-            if 'event_counter' in sensor_data:
-                result['event_counter'] = sensor_data['event_counter']
-                _LOGGER.info("EVENT COUNTER: %s", sensor_data['event_counter'])
-            if 'sensor_event' in sensor_data:
-                result['sensor_event'] = sensor_data['sensor_event']
-                _LOGGER.info("SENSOR EVENT: %s", sensor_data['sensor_event'])
-
-        _LOGGER.info("FINAL RESULT: %s", result)
-        return result
-
     @callback
     def _async_schedule_poll(self, _: datetime) -> None:
         """Schedule a poll of the device."""
         # Simple restart detection: if device exists but no data, default to off
         if self.data:
             self.last_update_success = True
-            self.async_update_listeners()
+            self._async_schedule_listener_update()
         else:
             # Device exists but no data (restart scenario) - keep available but no data
             self.last_update_success = False
             _LOGGER.debug("Device %s exists but no data - keeping available but no data (restart scenario)", self.address)
-            self.async_update_listeners()
+            self._async_schedule_listener_update()
 
     async def _discover_and_update_address(self) -> None:
         """Discover Gemns™ IoT devices and update the address if found."""
@@ -340,50 +446,83 @@ class GemnsBluetoothProcessorCoordinator(
             discovered_devices = async_discovered_service_info(self.hass)
 
             _LOGGER.info("Found %d total Bluetooth devices", len(discovered_devices))
-            for device in discovered_devices:
-                _LOGGER.info("Checking device: %s (%s)", device.name, device.address)
-                if self._is_gems_device(device):
-                    _LOGGER.info("Found Gemns™ IoT device: %s (%s)", device.name, device.address)
-                    # Update the config entry with the real MAC address
-                    new_data = self._entry.data.copy()
-                    new_data[CONF_ADDRESS] = device.address.upper()
-                    self.hass.config_entries.async_update_entry(self._entry, data=new_data)
-                    _LOGGER.info("Updated config entry with real MAC address: %s", device.address)
-
-                    # Update coordinator address dynamically
-                    await self._update_coordinator_address(device.address.upper())
-                    break
-            else:
-                _LOGGER.warning("No Gemns™ IoT devices found during discovery")
-                # Schedule another discovery attempt in 5 seconds
-                self.hass.async_create_task(self._schedule_next_discovery())
+            device = next(filter(self._is_gems_device, discovered_devices), None)
+            if device is not None:
+                await self._async_adopt_device(device)
+                return
+
+            _LOGGER.warning("No Gemns™ IoT devices found during discovery")
 
         except (ValueError, KeyError, AttributeError, TypeError) as e:
             _LOGGER.error("Discovery error: %s", e)
-            # Schedule another discovery attempt in 5 seconds
-            self.hass.async_create_task(self._schedule_next_discovery())
 
-    async def _schedule_next_discovery(self) -> None:
-        """Schedule the next discovery attempt."""
-        await asyncio.sleep(5)  # Wait 5 seconds
-        if self.address.startswith("gemns_discovery_"):
-            _LOGGER.info("Retrying discovery...")
-            await self._discover_and_update_address()
+        # Wait for the device to advertise instead of polling
+        self._async_wait_for_device()
+
+    async def _async_adopt_device(self, device: BluetoothServiceInfo) -> None:
+        """Switch this coordinator over to a discovered Gemns™ IoT device."""
+        _LOGGER.info("Found Gemns™ IoT device: %s (%s)", device.name, device.address)
+        address = device.address.upper()
+
+        # Update the config entry with the real MAC address
+        if self._entry.data.get(CONF_ADDRESS, "").upper() != address:
+            self.hass.config_entries.async_update_entry(
+                self._entry, data={**self._entry.data, CONF_ADDRESS: address}
+            )
+            _LOGGER.info("Updated config entry with real MAC address: %s", address)
+
+        # Update coordinator address dynamically
+        if self.address != address:
+            await self._update_coordinator_address(address)
+
+    @callback
+    def _async_wait_for_device(self) -> None:
+        """Register for Gemns™ IoT advertisements until a device is found."""
+        if self._cancel_discovery is not None:
+            return
+        _LOGGER.info("Waiting for Gemns™ IoT advertisement...")
+        self._cancel_discovery = async_register_callback(
+            self.hass,
+            self._async_handle_discovery,
+            BluetoothCallbackMatcher(manufacturer_id=BLE_COMPANY_ID),
+            BluetoothScanningMode.PASSIVE,
+        )
+
+    @callback
+    def _async_handle_discovery(
+        self,
+        service_info: BluetoothServiceInfoBleak,
+        change: BluetoothChange,
+    ) -> None:
+        """Handle an advertisement received while waiting for a device."""
+        if not self.address.startswith("gemns_discovery_"):
+            self._async_cancel_discovery()
+            return
+        if not self._is_gems_device(service_info):
+            return
+        self._async_cancel_discovery()
+        self.hass.async_create_task(self._async_adopt_device(service_info))
+
+    @callback
+    def _async_cancel_discovery(self) -> None:
+        """Stop waiting for Gemns™ IoT advertisements."""
+        if self._cancel_discovery is not None:
+            self._cancel_discovery()
+            self._cancel_discovery = None
 
     def _is_gems_device(self, discovery_info: BluetoothServiceInfo) -> bool:
         """Check if this is a Gemns™ IoT device."""
         # Check manufacturer data for Gemns™ IoT Company ID (22352)
         if discovery_info.manufacturer_data:
-            for manufacturer_id, data in discovery_info.manufacturer_data.items():
-                _LOGGER.info("Checking manufacturer data: Company ID %d, Data length: %d", manufacturer_id, len(data))
-                if manufacturer_id == BLE_COMPANY_ID and len(data) >= 20:
-                    _LOGGER.info("Found Gemns™ IoT device by manufacturer data")
-                    return True
+            data = discovery_info.manufacturer_data.get(BLE_COMPANY_ID)
+            if data is not None and len(data) >= 20:
+                _LOGGER.info("Found Gemns™ IoT device by manufacturer data")
+                return True
 
         # Check name patterns as fallback
-        name = discovery_info.name or ""
-        _LOGGER.info("Checking device name: '%s'", name)
-        if any(pattern in name.upper() for pattern in ["GEMNS", "GEMS"]):
+        name = discovery_info.name
+        _LOGGER.debug("Checking device name: '%s'", name)
+        if name and _GEMNS_NAME_RE.search(name):
             _LOGGER.info("Found Gemns™ IoT device by name pattern")
             return True
 
@@ -404,7 +543,7 @@ class GemnsBluetoothProcessorCoordinator(
                 parsed_data = self._parse_advertisement_data(service_info)
                 self.data = parsed_data
                 self.last_update_success = True
-                self.async_update_listeners()
+                self._async_schedule_listener_update()
                 _LOGGER.info("Device data updated: %s", parsed_data)
             else:
                 _LOGGER.warning("No advertisement found for device at %s", self.address)
@@ -419,31 +558,9 @@ class GemnsBluetoothProcessorCoordinator(
 
             # Create test data that simulates what would come from a real packet
             test_data = {
+                **_TEST_PACKET_TEMPLATE,
                 "address": self.address,
-                "name": "Gemns™ IoT Test Device Unit-001",
-                "rssi": -50,
-                "timestamp": datetime.now().isoformat(),
-                "device_type": "leak_sensor",
-                "sensor_data": {
-                    "device_type": 4,  # Leak sensor
-                    "leak_detected": False,
-                    "event_counter": 1
-                },
-                "battery_level": None,
-                "signal_strength": -50,
-                "firmware_version": "1.0",  # This simulates the parsed firmware version
-                "decrypted_data": {
-                    "src_id": 12345,
-                    "nwk_id": 6789,
-                    "fw_version": 16,  # Raw firmware byte (16 = 0x10)
-                    "firmware_version": "1.0",  # Parsed firmware version
-                    "device_type": b'\x00\x04',  # Leak sensor
-                    "payload": b'\x00\x00\x00\x00\x00\x00\x00\x00',
-                    "event_counter_lsb": 1,
-                    "payload_length": 0,
-                    "encrypt_status": 1,
-                    "power_status": 0,
-                }
+                "timestamp": time.time(),
             }
 
             # Update coordinator data
@@ -454,7 +571,7 @@ class GemnsBluetoothProcessorCoordinator(
             _LOGGER.info("TEST DATA: %s", test_data)
 
             # Notify listeners
-            self.async_update_listeners()
+            self._async_schedule_listener_update()
 
         except (ValueError, KeyError, AttributeError, TypeError) as e:
             _LOGGER.error("Error simulating test packet: %s", e)
@@ -462,6 +579,8 @@ class GemnsBluetoothProcessorCoordinator(
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator."""
         _LOGGER.info("Shutting down Gemns™ IoT BLE coordinator")
+        self._async_cancel_discovery()
+        self._async_cancel_listener_update()
         # Clean up any resources if needed
         self.data = {}
         self.last_update_success = False
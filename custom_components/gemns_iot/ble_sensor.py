@@ -11,12 +11,11 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.const import (
     CONF_DEVICE_ID,
-    CONF_NAME,
     CONF_UNIT_OF_MEASUREMENT,
     PERCENTAGE,
     UnitOfTemperature,
@@ -25,10 +24,78 @@ from homeassistant.const import (
 )
 
 from .const import DOMAIN, CONF_ADDRESS, CONF_NAME
+from .ble_binary_sensor import GemnsBLEBinarySensor
 from .ble_coordinator import GemnsBluetoothProcessorCoordinator
+from .util import professional_device_id
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device types (names and device_type_t values) handled by the binary sensor
+_BINARY_DEVICE_TYPES: frozenset[str | int] = frozenset({
+    "leak_sensor", 4,       # DEVICE_TYPE_LEAK_SENSOR = 4
+    "vibration_sensor", 2,  # DEVICE_TYPE_VIBRATION_MONITOR = 2
+    "two_way_switch", 3,    # DEVICE_TYPE_TWO_WAY_SWITCH = 3
+    "button", "legacy", 0, 1,  # DEVICE_TYPE_LEGACY = 0, DEVICE_TYPE_BUTTON = 1
+})
+
+# Device type substrings handled by other platforms (binary sensor, switch)
+_SKIPPED_TOKENS: tuple[str, ...] = ("leak", "switch")
+
+# Sensor properties per device type substring:
+# token -> (device class, unit, name prefix, icon)
+_SENSOR_SPECS: tuple[tuple[str, tuple[SensorDeviceClass | None, str | None, str, str]], ...] = (
+    ("temperature", (SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS, "Gemns™ IoT Button", "mdi:thermometer")),
+    ("humidity", (SensorDeviceClass.HUMIDITY, PERCENTAGE, "Gemns™ IoT Vibration Monitor", "mdi:water-percent")),
+    ("pressure", (SensorDeviceClass.PRESSURE, UnitOfPressure.HPA, "Gemns™ IoT Two Way Switch", "mdi:gauge")),
+    ("vibration", (SensorDeviceClass.VIBRATION, "m/s²", "Gemns™ IoT Vibration Sensor", "mdi:vibrate")),
+)
+# Generic sensor
+_DEFAULT_SENSOR_SPEC = (None, None, "Gemns™ IoT Sensor", "mdi:chip")
+
+# Device model per device type
+_MODEL_MAP: dict[str, str] = {
+    "leak_sensor": "Leak Sensor",
+    "button": "Button",
+    "vibration_monitor": "Vibration Monitor",
+    "two_way_switch": "Two Way Switch",
+    "vibration_sensor": "Vibration Sensor",
+    "on_off_switch": "On/Off Switch",
+    "light_switch": "Light Switch",
+    "door_switch": "Door Switch",
+    "toggle_switch": "Toggle Switch",
+    "unknown_device": "IoT Device"
+}
+
+# Device image per device type
+_DEFAULT_IMAGE = "/local/custom_components/gemns/static/icon.png"
+_IMAGE_MAP: dict[str, str] = {
+    "temperature_sensor": _DEFAULT_IMAGE,
+    "humidity_sensor": _DEFAULT_IMAGE,
+    "pressure_sensor": _DEFAULT_IMAGE,
+    "vibration_sensor": _DEFAULT_IMAGE,
+    "leak_sensor": _DEFAULT_IMAGE,
+    "on_off_switch": _DEFAULT_IMAGE,
+    "light_switch": _DEFAULT_IMAGE,
+    "door_switch": _DEFAULT_IMAGE,
+    "toggle_switch": _DEFAULT_IMAGE,
+}
+
+# Measurement keys in sensor_data, checked in order for the sensor value
+_SENSOR_KEYS: tuple[str, ...] = ("temperature", "humidity", "pressure", "vibration")
+
+# Signal percentage per RSSI dBm, indexed from _RSSI_MIN; RSSI typically
+# ranges from -100 (very weak, 0%) to -30 (very strong, 100%)
+_RSSI_MIN = -100
+_RSSI_PERCENT: tuple[float, ...] = tuple(
+    round((rssi - _RSSI_MIN) * 100 / 70, 1) for rssi in range(_RSSI_MIN, -29)
+)
+
+# sensor_data keys exposed as state attributes when present
+_SENSOR_ATTRIBUTE_KEYS: tuple[str, ...] = ("leak_detected", "event_counter", "sensor_event")
+
+# Sentinel for keys missing from sensor_data (values may legitimately be None)
+_MISSING = object()
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -36,80 +103,36 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Gemns™ IoT BLE sensors from a config entry."""
-    _LOGGER.info("Setting up BLE sensor for entry %s", config_entry.entry_id)
-    
     # Get address from config data or unique_id
     address = config_entry.data.get(CONF_ADDRESS)
     if not address or address == "00:00:00:00:00:00":
         address = config_entry.unique_id
     
     # If still no address, skip BLE sensor setup
-    if not address or address.startswith("gemns_temp_") or address.startswith("gemns_discovery_"):
-        _LOGGER.info("No real BLE device address found, skipping BLE sensor setup for entry %s", config_entry.entry_id)
+    if not address or address.startswith(("gemns_temp_", "gemns_discovery_")):
+        _LOGGER.debug("No real BLE device address found, skipping BLE sensor setup for entry %s", config_entry.entry_id)
         return
     
-    _LOGGER.info("BLE device address found: %s", address)
-
-    # Get the BLE coordinator from runtime_data
-    coordinator = config_entry.runtime_data
-    if not coordinator:
-        # Fallback: try to get from hass.data
-        _LOGGER.warning("No coordinator in runtime_data, trying hass.data for entry %s", config_entry.entry_id)
-        try:
-            coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-        except KeyError:
-            _LOGGER.error("No coordinator found in runtime_data or hass.data for entry %s", config_entry.entry_id)
-            return
-    
-    _LOGGER.info("BLE coordinator found for entry %s, creating sensor entities", config_entry.entry_id)
+    # Get the BLE coordinator from runtime_data, falling back to hass.data
+    coordinator = config_entry.runtime_data or (
+        hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {}).get("coordinator")
+    )
+    if coordinator is None:
+        _LOGGER.error("No coordinator found in runtime_data or hass.data for entry %s", config_entry.entry_id)
+        return
     
-    # Create entities based on device type
-    entities = []
+    _LOGGER.debug("Setting up BLE sensor for entry %s at %s", config_entry.entry_id, address)
     
     # Get device type from config to determine which entities to create
-    device_type = config_entry.data.get("device_name", "unknown")
     device_type = config_entry.data.get("device_type", 4)
     
-    _LOGGER.info("Creating entities for device type: %s, device_type: %d", device_type, device_type)
-    
-    # Create entities based on device type (matching device_type_t enum)
-    if device_type in ["leak_sensor"] or device_type == 4:
-        # DEVICE_TYPE_LEAK_SENSOR = 4 - create binary sensor only
-        from .ble_binary_sensor import GemnsBLEBinarySensor
-        binary_sensor_entity = GemnsBLEBinarySensor(coordinator, config_entry)
-        entities.append(binary_sensor_entity)
-        _LOGGER.info("Created binary sensor entity for leak sensor")
-        
-    elif device_type in ["vibration_sensor"] or device_type == 2:
-        # DEVICE_TYPE_VIBRATION_MONITOR = 2 - create binary sensor only
-        from .ble_binary_sensor import GemnsBLEBinarySensor
-        binary_sensor_entity = GemnsBLEBinarySensor(coordinator, config_entry)
-        entities.append(binary_sensor_entity)
-        _LOGGER.info("Created binary sensor entity for vibration monitor")
-        
-    elif device_type in ["two_way_switch"] or device_type == 3:
-        # DEVICE_TYPE_TWO_WAY_SWITCH = 3 - create binary sensor only
-        from .ble_binary_sensor import GemnsBLEBinarySensor
-        binary_sensor_entity = GemnsBLEBinarySensor(coordinator, config_entry)
-        entities.append(binary_sensor_entity)
-        _LOGGER.info("Created binary sensor entity for two-way switch")
-        
-    elif device_type in ["button", "legacy"] or device_type in [0, 1]:
-        # DEVICE_TYPE_LEGACY = 0, DEVICE_TYPE_BUTTON = 1 - create binary sensor only
-        from .ble_binary_sensor import GemnsBLEBinarySensor
-        binary_sensor_entity = GemnsBLEBinarySensor(coordinator, config_entry)
-        entities.append(binary_sensor_entity)
-        _LOGGER.info("Created binary sensor entity for button/legacy device")
-        
-    else:
-        # Unknown device type - create binary sensor (fallback)
+    # Every device type (matching device_type_t enum) is exposed as a binary
+    # sensor: leak sensor (4), vibration monitor (2), two-way switch (3),
+    # button (1) and legacy (0); unknown types fall back to one as well
+    if device_type not in _BINARY_DEVICE_TYPES:
         _LOGGER.warning("Unknown device type %s, creating binary sensor", device_type)
-        from .ble_binary_sensor import GemnsBLEBinarySensor
-        binary_sensor_entity = GemnsBLEBinarySensor(coordinator, config_entry)
-        entities.append(binary_sensor_entity)
-    
-    if entities:
-        async_add_entities(entities)
+    _LOGGER.debug("Creating binary sensor entity for device type: %s", device_type)
+    async_add_entities((GemnsBLEBinarySensor(coordinator, config_entry),))
 
 
 class GemnsBLESensor(SensorEntity):
@@ -148,6 +171,11 @@ class GemnsBLESensor(SensorEntity):
         
         # Device type will be determined from coordinator data
         self._device_type = "unknown"
+        # (address, name, model, firmware version) the device info was built for
+        self._device_info_key: tuple[str, str | None, str, str] | None = None
+        # State attributes, rebuilt on coordinator updates rather than per read
+        self._attrs: Dict[str, Any] = {}
+        self._update_attributes(self.coordinator.data)
         
     @property
     def address(self) -> str:
@@ -162,6 +190,11 @@ class GemnsBLESensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return entity specific state attributes."""
+        return self._attrs
+
+    @callback
+    def _update_attributes(self, data: Dict[str, Any] | None) -> None:
+        """Rebuild the state attributes from coordinator data."""
         attrs = {
             "address": self.address,
             "device_type": self._device_type,
@@ -175,29 +208,28 @@ class GemnsBLESensor(SensorEntity):
         }
         
         # Add data from coordinator if available
-        if self.coordinator.data:
+        if data:
+            available = self.coordinator.available
             attrs.update({
-                "rssi": self.coordinator.data.get("rssi"),
-                "signal_strength": self.coordinator.data.get("signal_strength"),
-                "battery_level": self.coordinator.data.get("battery_level"),
-                "last_seen": self.coordinator.data.get("timestamp"),
+                "rssi": data.get("rssi"),
+                "signal_strength": data.get("signal_strength"),
+                "battery_level": data.get("battery_level"),
+                "last_seen": self.coordinator.last_seen,
                 "ble_active": True,  # If we have data, BLE is active
-                "ble_connected": self.coordinator.available,  # Use coordinator availability
-                "ble_status": "active" if self.coordinator.available else "inactive",
-                "last_update_success": getattr(self.coordinator, 'last_update_success', True),
+                "ble_connected": available,  # Use coordinator availability
+                "ble_status": "active" if available else "inactive",
+                "last_update_success": self.coordinator.last_update_success,
             })
             
             # Add sensor-specific attributes
-            if "sensor_data" in self.coordinator.data:
-                sensor_data = self.coordinator.data["sensor_data"]
-                if "leak_detected" in sensor_data:
-                    attrs["leak_detected"] = sensor_data["leak_detected"]
-                if "event_counter" in sensor_data:
-                    attrs["event_counter"] = sensor_data["event_counter"]
-                if "sensor_event" in sensor_data:
-                    attrs["sensor_event"] = sensor_data["sensor_event"]
+            sensor_data = data.get("sensor_data")
+            if sensor_data:
+                for key in _SENSOR_ATTRIBUTE_KEYS:
+                    value = sensor_data.get(key, _MISSING)
+                    if value is not _MISSING:
+                        attrs[key] = value
         
-        return attrs
+        self._attrs = attrs
 
     async def async_added_to_hass(self) -> None:
         """Call when entity is added to hass."""
@@ -207,44 +239,45 @@ class GemnsBLESensor(SensorEntity):
         # Set up cleanup when entity is removed
         self.async_on_remove(self._unsub_coordinator)
 
+    @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        try:
-            self._update_from_coordinator()
-            self.async_write_ha_state()
-        except Exception as e:
-            _LOGGER.error("Error handling coordinator update for %s: %s", self.address, e)
+        self._update_from_coordinator()
+        self.async_write_ha_state()
 
+    @callback
     def _update_from_coordinator(self) -> None:
         """Update sensor state from coordinator data."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             # Simple restart detection: if device exists but no data, keep available but no value
             self._attr_available = True  # Keep available, just no data
             self._attr_native_value = None
             _LOGGER.debug("BLE sensor %s: No coordinator data - device available but no data (restart scenario)", self.address)
+            self._update_attributes(data)
             return
             
-        data = self.coordinator.data
-        _LOGGER.info("UPDATING SENSOR: %s | Coordinator data: %s", self.address, data)
         
         # Update device type
         self._device_type = data.get("device_type", "unknown")
-        _LOGGER.info("DEVICE TYPE: %s | Type: %s", self.address, self._device_type)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("UPDATING SENSOR: %s | Type: %s | Keys: %s",
+                          self.address, self._device_type, list(data))
         
         # Set sensor properties based on device type
         self._set_sensor_properties()
         
         # Update device info with proper name and model
-        self._update_device_info()
+        self._update_device_info(data)
         
         # Extract sensor value
         self._extract_sensor_value(data)
         
         # Update availability
         self._attr_available = True
-        _LOGGER.info("SENSOR UPDATED: %s | Available: %s | Value: %s | BLE_active: %s | Coordinator_available: %s", 
-                     self.address, self._attr_available, self._attr_native_value, True, self.coordinator.available)
+        self._update_attributes(data)
         
+    @callback
     def _set_sensor_properties(self) -> None:
         """Set sensor properties based on device type."""
         device_type = self._device_type.lower()
@@ -255,79 +288,46 @@ class GemnsBLESensor(SensorEntity):
         self._attr_native_unit_of_measurement = None
         self._attr_icon = None
         
-        # Get short address for display
-        short_address = self.address.replace(":", "")[-6:].upper()
-        
-        # Set properties based on device type
-        # Skip leak sensors - they should be handled by binary sensor
-        if "leak" in device_type:
-            # Don't create sensor entities for leak sensors
-            return
-            
-        # Skip switch devices - they should be handled by switch platform
-        if "switch" in device_type:
-            # Don't create sensor entities for switch devices
+        # Skip leak sensors (binary sensor) and switch devices (switch platform)
+        if any(token in device_type for token in _SKIPPED_TOKENS):
             return
-            
-        if "temperature" in device_type:
-            self._attr_device_class = SensorDeviceClass.TEMPERATURE
-            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-            self._attr_name = f"Gemns™ IoT Button {self._get_professional_device_id()}"
-            self._attr_icon = "mdi:thermometer"
-            
-        elif "humidity" in device_type:
-            self._attr_device_class = SensorDeviceClass.HUMIDITY
-            self._attr_native_unit_of_measurement = PERCENTAGE
-            self._attr_name = f"Gemns™ IoT Vibration Monitor {self._get_professional_device_id()}"
-            self._attr_icon = "mdi:water-percent"
-            
-        elif "pressure" in device_type:
-            self._attr_device_class = SensorDeviceClass.PRESSURE
-            self._attr_native_unit_of_measurement = UnitOfPressure.HPA
-            self._attr_name = f"Gemns™ IoT Two Way Switch {self._get_professional_device_id()}"
-            self._attr_icon = "mdi:gauge"
-            
-        elif "vibration" in device_type:
-            self._attr_device_class = SensorDeviceClass.VIBRATION
-            self._attr_native_unit_of_measurement = "m/s²"
-            self._attr_name = f"Gemns™ IoT Vibration Sensor {self._get_professional_device_id()}"
-            self._attr_icon = "mdi:vibrate"
-            
-        else:
-            # Generic sensor
-            self._attr_name = f"Gemns™ IoT Sensor {self._get_professional_device_id()}"
-            self._attr_icon = "mdi:chip"
+        
+        # Set properties based on device type; first matching token wins
+        device_class, unit, name_prefix, icon = next(
+            (spec for token, spec in _SENSOR_SPECS if token in device_type),
+            _DEFAULT_SENSOR_SPEC,
+        )
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        device_id = professional_device_id(self.address, self.config_entry.entry_id)
+        self._attr_name = f"{name_prefix} {device_id}"
+        self._attr_icon = icon
 
-    def _update_device_info(self) -> None:
+    @callback
+    def _update_device_info(self, data: Dict[str, Any]) -> None:
         """Update device info with proper name and model."""
         device_type = self._device_type.lower()
         
-        # Set model based on device type
-        model_map = {
-            "leak_sensor": "Leak Sensor",
-            "button": "Button",
-            "vibration_sensor": "Vibration Monitor",
-            "two_way_switch": "Two Way Switch",
-            "vibration_sensor": "Vibration Sensor",
-            "on_off_switch": "On/Off Switch",
-            "light_switch": "Light Switch",
-            "door_switch": "Door Switch",
-            "toggle_switch": "Toggle Switch",
-            "unknown_device": "IoT Device"
-        }
+        model = _MODEL_MAP.get(device_type, "IoT Sensor")
+        address = self.address
+        sw_version = data.get("firmware_version", "1.0.0")
         
-        model = model_map.get(device_type, "IoT Sensor")
+        # Device info only changes with the address, name, model or firmware
+        device_info_key = (address, self._attr_name, model, sw_version)
+        if device_info_key == self._device_info_key:
+            return
+        self._device_info_key = device_info_key
         
         # Set device image based on device type
         device_image = self._get_device_image(device_type)
         
         # Update device info
         self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self.address)},
+            identifiers={(DOMAIN, address)},
             name=self._attr_name,
             manufacturer="Gemns™ IoT",
             model=model,
-            sw_version=self.coordinator.data.get("firmware_version", "1.0.0"),
+            sw_version=sw_version,
         )
         
         # Set device image if available
@@ -336,75 +336,55 @@ class GemnsBLESensor(SensorEntity):
     
     def _get_device_image(self, device_type: str) -> str:
         """Get device image URL based on device type."""
-        # Map device types to their corresponding image paths
-        image_map = {
-            "temperature_sensor": "/local/custom_components/gemns/static/icon.png",
-            "humidity_sensor": "/local/custom_components/gemns/static/icon.png", 
-            "pressure_sensor": "/local/custom_components/gemns/static/icon.png",
-            "vibration_sensor": "/local/custom_components/gemns/static/icon.png",
-            "leak_sensor": "/local/custom_components/gemns/static/icon.png",
-            "on_off_switch": "/local/custom_components/gemns/static/icon.png",
-            "light_switch": "/local/custom_components/gemns/static/icon.png",
-            "door_switch": "/local/custom_components/gemns/static/icon.png",
-            "toggle_switch": "/local/custom_components/gemns/static/icon.png",
-        }
-        
-        return image_map.get(device_type.lower(), "/local/custom_components/gemns/static/icon.png")
+        return _IMAGE_MAP.get(device_type.lower(), _DEFAULT_IMAGE)
             
+    @callback
     def _extract_sensor_value(self, data: Dict[str, Any]) -> None:
         """Extract sensor value from coordinator data."""
-        _LOGGER.info("EXTRACTING SENSOR VALUE: %s | Data: %s", self.address, data)
-        
         # Try to get sensor value from sensor_data
         sensor_data = data.get("sensor_data", {})
-        _LOGGER.info("SENSOR DATA: %s | Sensor data: %s", self.address, sensor_data)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
         
         # Skip leak sensors - they should be handled by binary sensor
         if "leak_detected" in sensor_data:
             # Don't process leak sensors in regular sensor
-            _LOGGER.info("LEAK SENSOR SKIPPED: %s | Leak detected: %s (handled by binary sensor)", 
-                        self.address, sensor_data["leak_detected"])
-            
-        elif "temperature" in sensor_data:
-            self._attr_native_value = sensor_data["temperature"]
-            _LOGGER.info("TEMPERATURE SENSOR: %s | Temperature: %s", 
-                        self.address, self._attr_native_value)
-            
-        elif "humidity" in sensor_data:
-            self._attr_native_value = sensor_data["humidity"]
-            _LOGGER.info("HUMIDITY SENSOR: %s | Humidity: %s", 
-                        self.address, self._attr_native_value)
-            
-        elif "pressure" in sensor_data:
-            self._attr_native_value = sensor_data["pressure"]
-            _LOGGER.info("PRESSURE SENSOR: %s | Pressure: %s", 
-                        self.address, self._attr_native_value)
-            
-        elif "vibration" in sensor_data:
-            self._attr_native_value = sensor_data["vibration"]
-            _LOGGER.info("VIBRATION SENSOR: %s | Vibration: %s", 
-                        self.address, self._attr_native_value)
-            
-        elif "battery_level" in data and data["battery_level"] is not None:
+            if debug:
+                _LOGGER.debug("LEAK SENSOR SKIPPED: %s | Leak detected: %s (handled by binary sensor)",
+                              self.address, sensor_data["leak_detected"])
+            return
+        
+        # First measurement key present wins
+        for key in _SENSOR_KEYS:
+            value = sensor_data.get(key)
+            if value is not None:
+                self._attr_native_value = value
+                if debug:
+                    _LOGGER.debug("SENSOR VALUE: %s | %s: %s", self.address, key, value)
+                return
+        
+        battery_level = data.get("battery_level")
+        if battery_level is not None:
             # Use battery level as a fallback sensor value
-            self._attr_native_value = data["battery_level"]
-            _LOGGER.info("BATTERY LEVEL: %s | Battery: %s", 
-                        self.address, self._attr_native_value)
-            
-        else:
-            # No specific sensor value found, use RSSI as a signal strength indicator
-            rssi = data.get("rssi")
-            if rssi is not None:
-                # Convert RSSI to a percentage (rough approximation)
-                # RSSI typically ranges from -100 (very weak) to -30 (very strong)
-                signal_percentage = max(0, min(100, (rssi + 100) * 100 / 70))
-                self._attr_native_value = round(signal_percentage, 1)
-                _LOGGER.info("RSSI SIGNAL: %s | RSSI: %s dBm | Signal: %s%%", 
-                            self.address, rssi, self._attr_native_value)
+            self._attr_native_value = battery_level
+            if debug:
+                _LOGGER.debug("BATTERY LEVEL: %s | Battery: %s",
+                              self.address, self._attr_native_value)
+            return
+        
+        # No specific sensor value found, use RSSI as a signal strength indicator
+        rssi = data.get("rssi")
+        if rssi is not None:
+            # Convert RSSI to a percentage (rough approximation)
+            index = rssi - _RSSI_MIN
+            if index <= 0:
+                self._attr_native_value = 0.0
+            elif index >= len(_RSSI_PERCENT):
+                self._attr_native_value = 100.0
             else:
-                self._attr_native_value = None
-                _LOGGER.warning("NO SENSOR VALUE: %s | No RSSI or sensor data found", self.address)
-
-    async def async_update(self) -> None:
-        """Update sensor state."""
-        await self.coordinator.async_request_refresh()
+                self._attr_native_value = _RSSI_PERCENT[index]
+            if debug:
+                _LOGGER.debug("RSSI SIGNAL: %s | RSSI: %s dBm | Signal: %s%%",
+                              self.address, rssi, self._attr_native_value)
+        else:
+            self._attr_native_value = None
+            _LOGGER.warning("NO SENSOR VALUE: %s | No RSSI or sensor data found", self.address)
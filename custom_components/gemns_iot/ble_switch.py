@@ -12,6 +12,7 @@ from homeassistant.helpers.entity import DeviceInfo
 
 from .const import DOMAIN, CONF_ADDRESS
 from .ble_coordinator import GemnsBluetoothProcessorCoordinator
+from .util import professional_device_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,15 +42,8 @@ async def async_setup_entry(
     
     _LOGGER.info("BLE coordinator found for entry %s, creating switch entities", config_entry.entry_id)
     
-    # Create switch entities based on device type
-    entities = []
-    
     # Create a switch entity for switch devices
-    switch_entity = GemnsBLESwitch(coordinator, config_entry)
-    entities.append(switch_entity)
-    
-    if entities:
-        async_add_entities(entities)
+    async_add_entities((GemnsBLESwitch(coordinator, config_entry),))
 
 
 class GemnsBLESwitch(SwitchEntity):
@@ -117,11 +111,11 @@ class GemnsBLESwitch(SwitchEntity):
                 "rssi": self.coordinator.data.get("rssi"),
                 "signal_strength": self.coordinator.data.get("signal_strength"),
                 "battery_level": self.coordinator.data.get("battery_level"),
-                "last_seen": self.coordinator.data.get("timestamp"),
+                "last_seen": self.coordinator.last_seen,
                 "ble_active": True,  # If we have data, BLE is active
                 "ble_connected": self.coordinator.available,  # Use coordinator availability
                 "ble_status": "active" if self.coordinator.available else "inactive",
-                "last_update_success": getattr(self.coordinator, 'last_update_success', True),
+                "last_update_success": self.coordinator.last_update_success,
             })
             
             # Add sensor-specific attributes
@@ -193,24 +187,24 @@ class GemnsBLESwitch(SwitchEntity):
         """Set switch properties based on device type."""
         device_type = self._device_type.lower()
         
-        # Get short address for display
-        short_address = self.address.replace(":", "")[-6:].upper()
+        # Get professional device ID for display
+        device_id = professional_device_id(self.address, self.config_entry.entry_id)
         
         # Set properties based on device type
         if "light" in device_type:
-            self._attr_name = f"Gemns™ IoT Light Switch {self._get_professional_device_id()}"
+            self._attr_name = f"Gemns™ IoT Light Switch {device_id}"
             self._attr_icon = "mdi:lightbulb"
             
         elif "door" in device_type:
-            self._attr_name = f"Gemns™ IoT Door Switch {self._get_professional_device_id()}"
+            self._attr_name = f"Gemns™ IoT Door Switch {device_id}"
             self._attr_icon = "mdi:door"
             
         elif "toggle" in device_type:
-            self._attr_name = f"Gemns™ IoT Toggle Switch {self._get_professional_device_id()}"
+            self._attr_name = f"Gemns™ IoT Toggle Switch {device_id}"
             self._attr_icon = "mdi:toggle-switch"
             
         elif "switch" in device_type:
-            self._attr_name = f"Gemns™ IoT On/Off Switch {self._get_professional_device_id()}"
+            self._attr_name = f"Gemns™ IoT On/Off Switch {device_id}"
             self._attr_icon = "mdi:power"
             
         else:
@@ -253,16 +247,6 @@ class GemnsBLESwitch(SwitchEntity):
         if device_image:
             self._attr_device_info["image"] = device_image
 
-    def _get_professional_device_id(self) -> str:
-        """Generate a professional device identifier from MAC address."""
-        # Remove colons and get last 6 characters
-        clean_address = self.address.replace(":", "").upper()
-        last_6 = clean_address[-6:]
-        
-        # Convert to a more professional format
-        device_number = int(last_6, 16) % 1000  # Get a number between 0-999
-        return f"Unit-{device_number:03d}"
-    
     def _get_device_image(self, device_type: str) -> str:
         """Get device image URL based on device type."""
         # Map device types to their corresponding image paths
@@ -315,7 +299,3 @@ class GemnsBLESwitch(SwitchEntity):
         # The switch state is determined by the device's sensor_event data
         _LOGGER.warning("Switch control is read-only. State is determined by device sensor_event data.")
         self.async_write_ha_state()
-
-    async def async_update(self) -> None:
-        """Update switch state."""
-        await self.coordinator.async_request_refresh()
@@ -45,6 +45,8 @@ class GemnsDeviceManager:
         self.hass = hass
         self.config = config
         self.devices: Dict[str, Dict[str, Any]] = {}
+        # Devices bucketed by device type, kept in sync with self.devices
+        self.devices_by_type: Dict[str, Dict[str, Dict[str, Any]]] = {}
         self.entity_registry = er.async_get(hass)
         self._subscribers = {}
         self._mqtt_client = None
@@ -84,7 +86,7 @@ class GemnsDeviceManager:
                 "properties": {}
             }
             
-            self.devices[device_id] = device
+            self._store_device(device)
             
             # Notify subscribers - this is called from async context, so it's safe
             self.hass.async_create_task(
@@ -98,6 +100,32 @@ class GemnsDeviceManager:
             _LOGGER.error(f"Error adding device: {e}")
             return False
             
+    def remove_device(self, device_id: str) -> bool:
+        """Remove a device by ID."""
+        device = self.devices.pop(device_id, None)
+        if device is None:
+            return False
+        self._unindex_device(device)
+        return True
+        
+    def _store_device(self, device: Dict[str, Any]) -> None:
+        """Store a device and update the type index."""
+        device_id = device["device_id"]
+        previous = self.devices.get(device_id)
+        if previous is not None:
+            self._unindex_device(previous)
+        self.devices[device_id] = device
+        self.devices_by_type.setdefault(device.get("device_type"), {})[device_id] = device
+        
+    def _unindex_device(self, device: Dict[str, Any]) -> None:
+        """Remove a device from the type index."""
+        device_type = device.get("device_type")
+        bucket = self.devices_by_type.get(device_type)
+        if bucket is not None:
+            bucket.pop(device["device_id"], None)
+            if not bucket:
+                del self.devices_by_type[device_type]
+            
     def get_device(self, device_id: str) -> Optional[Dict[str, Any]]:
         """Get a device by ID."""
         return self.devices.get(device_id)
@@ -112,7 +140,7 @@ class GemnsDeviceManager:
         
     def get_devices_by_type(self, device_type: str) -> List[Dict[str, Any]]:
         """Get devices by type."""
-        return [d for d in self.devices.values() if d.get("device_type") == device_type]
+        return list(self.devices_by_type.get(device_type, {}).values())
         
     def get_devices_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Get devices by status."""
@@ -172,7 +200,9 @@ class GemnsDeviceManager:
                 if "properties" not in data:
                     data["properties"] = {}
                     
-                self.devices[device_id] = data
+                # This handler runs off the event loop, so mutate the device
+                # indexes there; FIFO scheduling keeps it ahead of the notify
+                self.hass.loop.call_soon_threadsafe(self._store_device, data)
                 _LOGGER.info(f"Updated device {device_id} with status: {data.get('status')}")
                 
                 # Schedule the dispatcher call in the main event loop
@@ -14,6 +14,22 @@ COMPANY_ID = 0x0F9C  # Gemns™ IoT company ID
 PACKET_LENGTH = 18  # Total packet length (HA BLE driver filters company ID)
 ENCRYPTED_DATA_SIZE = 16
 
+
+def _build_crc8_table(poly: int) -> bytes:
+    """Build the byte-wise lookup table for a non-reflected CRC-8."""
+    table = bytearray(256)
+    for value in range(256):
+        crc = value
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly if crc & 0x80 else crc << 1) & 0xFF
+        table[value] = crc
+    return bytes(table)
+
+
+# CRC-8 polynomial 0x07, one table lookup per input byte
+_CRC8_TABLE = _build_crc8_table(0x07)
+
+
 class GemnsPacketFlags:
     """Flags field parser for Gemns™ IoT packets."""
 
@@ -43,14 +59,15 @@ class GemnsEncryptedData:
         self.device_type = data[6:8]  # 2 bytes - Device type
         self.payload = data[8:16]  # 8 bytes - Custom payload
 
-        _LOGGER.info("ENCRYPTED DATA PARSING:")
-        _LOGGER.info("  Raw data: %s", data.hex())
-        _LOGGER.info("  Raw data bytes: %s", [hex(b) for b in data])
-        _LOGGER.info("  SRC ID (bytes 0-2): %s", self.src_id.hex())
-        _LOGGER.info("  NWK ID (bytes 3-4): %s", self.nwk_id.hex())
-        _LOGGER.info("  FW Version (byte 5): %d (0x%02X)", self.fw_version, self.fw_version)
-        _LOGGER.info("  Device Type (bytes 6-7): %s", self.device_type.hex())
-        _LOGGER.info("  Payload (bytes 8-15): %s", self.payload.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("ENCRYPTED DATA PARSING:")
+            _LOGGER.debug("  Raw data: %s", data.hex())
+            _LOGGER.debug("  Raw data bytes: %s", [hex(b) for b in data])
+            _LOGGER.debug("  SRC ID (bytes 0-2): %s", self.src_id.hex())
+            _LOGGER.debug("  NWK ID (bytes 3-4): %s", self.nwk_id.hex())
+            _LOGGER.debug("  FW Version (byte 5): %d (0x%02X)", self.fw_version, self.fw_version)
+            _LOGGER.debug("  Device Type (bytes 6-7): %s", self.device_type.hex())
+            _LOGGER.debug("  Payload (bytes 8-15): %s", self.payload.hex())
 
 class GemnsPacket:
     """Parser for Gemns™ IoT BLE packets."""
@@ -68,8 +85,8 @@ class GemnsPacket:
         self.encrypted_data = GemnsEncryptedData(raw_data[1:17])  # 16 bytes encrypted data
         self.crc = raw_data[17]  # 1 byte CRC (position 17, not 16!)
 
-        _LOGGER.info("PACKET STRUCTURE: Length=%d, Flags=0x%02X, CRC=0x%02X",
-                    len(raw_data), raw_data[0], self.crc)
+        _LOGGER.debug("PACKET STRUCTURE: Length=%d, Flags=0x%02X, CRC=0x%02X",
+                      len(raw_data), raw_data[0], self.crc)
 
     def is_valid_company_id(self) -> bool:
         """Check if this is a Gemns™ IoT packet."""
@@ -89,14 +106,15 @@ class GemnsPacket:
         data_to_check = full_packet[:-1]
         calculated_crc = self._calculate_crc8(data_to_check)
 
-        _LOGGER.info("CRC VALIDATION:")
-        _LOGGER.info("  Company ID bytes: %s", company_id_bytes.hex())
-        _LOGGER.info("  Raw data: %s", self.raw_data.hex())
-        _LOGGER.info("  Full packet: %s", full_packet.hex())
-        _LOGGER.info("  Data to check: %s", data_to_check.hex())
-        _LOGGER.info("  Calculated CRC: 0x%02X", calculated_crc)
-        _LOGGER.info("  Expected CRC: 0x%02X", self.crc)
-        _LOGGER.info("  Match: %s", calculated_crc == self.crc)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("CRC VALIDATION:")
+            _LOGGER.debug("  Company ID bytes: %s", company_id_bytes.hex())
+            _LOGGER.debug("  Raw data: %s", self.raw_data.hex())
+            _LOGGER.debug("  Full packet: %s", full_packet.hex())
+            _LOGGER.debug("  Data to check: %s", data_to_check.hex())
+            _LOGGER.debug("  Calculated CRC: 0x%02X", calculated_crc)
+            _LOGGER.debug("  Expected CRC: 0x%02X", self.crc)
+            _LOGGER.debug("  Match: %s", calculated_crc == self.crc)
 
         return calculated_crc == self.crc
 
@@ -107,13 +125,7 @@ class GemnsPacket:
         crc = 0x00  # Initial value
 
         for byte in data:
-            crc ^= byte
-            for _ in range(8):
-                if crc & 0x80:
-                    crc = (crc << 1) ^ 0x07
-                else:
-                    crc <<= 1
-                crc &= 0xFF
+            crc = _CRC8_TABLE[crc ^ byte]
 
         return crc
 
@@ -138,10 +150,11 @@ class GemnsPacket:
             # Parse decrypted data
             decrypted_packet = GemnsEncryptedData(decrypted_data)
 
-            _LOGGER.info("DECRYPTED DATA ANALYSIS:")
-            _LOGGER.info("  Decrypted data length: %d", len(decrypted_data))
-            _LOGGER.info("  Decrypted data hex: %s", decrypted_data.hex())
-            _LOGGER.info("  Decrypted data bytes: %s", [hex(b) for b in decrypted_data])
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("DECRYPTED DATA ANALYSIS:")
+                _LOGGER.debug("  Decrypted data length: %d", len(decrypted_data))
+                _LOGGER.debug("  Decrypted data hex: %s", decrypted_data.hex())
+                _LOGGER.debug("  Decrypted data bytes: %s", [hex(b) for b in decrypted_data])
 
             # Format firmware version: single byte -> X.Y format
             # First 4 bits = major version (left of decimal)
@@ -151,8 +164,8 @@ class GemnsPacket:
             minor_version = fw_byte & 0x0F
             firmware_version = f"{major_version}.{minor_version}"
 
-            _LOGGER.info("FIRMWARE VERSION PARSING: Raw byte=%d (0x%02X) -> Major=%d, Minor=%d -> Version='%s'",
-                        fw_byte, fw_byte, major_version, minor_version, firmware_version)
+            _LOGGER.debug("FIRMWARE VERSION PARSING: Raw byte=%d (0x%02X) -> Major=%d, Minor=%d -> Version='%s'",
+                          fw_byte, fw_byte, major_version, minor_version, firmware_version)
 
             return {
                 'src_id': struct.unpack('<I', decrypted_packet.src_id + b'\x00')[0],  # Convert 3 bytes to 32-bit int
@@ -177,10 +190,11 @@ class GemnsPacket:
         device_type = struct.unpack('<H', device_type_bytes)[0]  # Little-endian unsigned short
         payload = decrypted_data['payload']  # Already bytes
 
-        _LOGGER.info("SENSOR DATA PARSING:")
-        _LOGGER.info("  Device type bytes: %s", device_type_bytes.hex())
-        _LOGGER.info("  Device type decimal: %d", device_type)
-        _LOGGER.info("  Payload: %s", payload.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("SENSOR DATA PARSING:")
+            _LOGGER.debug("  Device type bytes: %s", device_type_bytes.hex())
+            _LOGGER.debug("  Device type decimal: %d", device_type)
+            _LOGGER.debug("  Payload: %s", payload.hex())
 
         sensor_data = {
             'device_type': device_type,
@@ -244,7 +258,7 @@ class GemnsPacket:
                     'switch_on': False,
                 })
 
-        elif device_type in [0, 1]:  # DEVICE_TYPE_LEGACY, DEVICE_TYPE_BUTTON
+        elif device_type in (0, 1):  # DEVICE_TYPE_LEGACY, DEVICE_TYPE_BUTTON
             if len(payload) >= 4:
                 event_counter = struct.unpack('<I', payload[0:3] + b'\x00')[0]
                 sensor_event = payload[3]
@@ -31,6 +31,14 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device categories handled by the switch platform
+_SWITCH_CATEGORIES: tuple[str, ...] = (
+    DEVICE_CATEGORY_SWITCH,
+    DEVICE_CATEGORY_LIGHT,
+    DEVICE_CATEGORY_DOOR,
+    DEVICE_CATEGORY_TOGGLE,
+)
+
 # Global variable to track entities and add callback
 _entities = []
 _add_entities_callback = None
@@ -54,10 +62,8 @@ async def async_setup_entry(
         
     # Get all switch devices
     switch_devices = []
-    switch_devices.extend(device_manager.get_devices_by_category(DEVICE_CATEGORY_SWITCH))
-    switch_devices.extend(device_manager.get_devices_by_category(DEVICE_CATEGORY_LIGHT))
-    switch_devices.extend(device_manager.get_devices_by_category(DEVICE_CATEGORY_DOOR))
-    switch_devices.extend(device_manager.get_devices_by_category(DEVICE_CATEGORY_TOGGLE))
+    for category in _SWITCH_CATEGORIES:
+        switch_devices.extend(device_manager.get_devices_by_category(category))
     
     # Create switch entities
     entities = []
@@ -73,7 +79,7 @@ async def async_setup_entry(
     async def handle_new_device(device_data):
         """Handle new device added."""
         category = device_data.get("category")
-        if category in [DEVICE_CATEGORY_SWITCH, DEVICE_CATEGORY_LIGHT, DEVICE_CATEGORY_DOOR, DEVICE_CATEGORY_TOGGLE]:
+        if category in _SWITCH_CATEGORIES:
             # Check if entity already exists
             device_id = device_data.get("device_id")
             existing_entity = next((e for e in _entities if e.device_id == device_id), None)
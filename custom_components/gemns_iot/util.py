@@ -0,0 +1,26 @@
+"""Shared helpers for the Gemns™ IoT integration."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import hashlib
+
+
+@lru_cache(maxsize=64)
+def professional_device_id(address: str, entry_id: str | None = None) -> str:
+    """Generate a professional device identifier from MAC address."""
+    # Handle test/discovery addresses
+    if entry_id is not None and (
+        address.startswith("gemns_") or address == "00:00:00:00:00:00"
+    ):
+        # For test devices, use entry ID to generate a consistent ID
+        hash_hex = hashlib.md5(entry_id.encode()).hexdigest()
+        device_number = int(hash_hex[:3], 16) % 1000
+        return f"Test-{device_number:03d}"
+
+    # Remove colons and get last 6 characters
+    last_6 = address.replace(":", "").upper()[-6:]
+
+    # Convert to a more professional format
+    device_number = int(last_6, 16) % 1000  # Get a number between 0-999
+    return f"Unit-{device_number:03d}"